@@ -30,12 +30,13 @@ class AVL(BST):
     AVL Tree class. Inherits from BST
     """
 
-    def __init__(self, start_tree=None) -> None:
+    def __init__(self, start_tree=None, node_type=AVLNode) -> None:
         """
         Initialize a new AVL Tree
+        node_type builds the nodes, e.g. compact_nodes.CompactAVLNode
         """
         # call __init__() from parent class
-        super().__init__(start_tree)
+        super().__init__(start_tree, node_type)
 
     def __str__(self) -> str:
         """
@@ -94,7 +95,7 @@ class AVL(BST):
         nothing
         """
         
-        new_node = AVLNode(value)
+        new_node = self._node_type(value)
 
         p = None
 
@@ -0,0 +1,722 @@
+"""
+Benchmarks for the data structures in this project.
+
+Run all benchmarks:          python benchmarks.py
+Run selected benchmarks:     python benchmarks.py typed_memory ...
+"""
+import operator
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy_backend
+from avl import AVL, AVLNode
+from bst import BST, BSTNode
+from bst_pool import PooledAVL, PooledBST
+from compact_nodes import (CompactAVLNode, CompactBSTNode, CompactChainNode,
+                           CompactHashEntry, CompactSLNode)
+from dynamic_array import DynamicArray, DynamicArrayException
+from fenwick import FenwickIndex
+from gap_buffer import GapBufferArray
+from hash_map_oa import HashMap as OpenAddressingMap
+from hash_map_sc import HashMap as ChainingMap
+from include import HashEntry
+from include import SLNode as ChainNode
+from min_heap import MinHeap, heapsort
+from mmap_array import MmapDynamicArray
+from range_query import SegmentTree, SparseTable
+from static_array_ops import copy_range
+from static_array_pool import StaticArrayPool
+from queue_sa import Queue
+from queue_sll import Queue as LinkedQueue
+from sll import LinkedList
+from SLNode import SLNode
+from stack_sll import Stack as LinkedStack
+from tiered_array import TieredArray
+
+
+def _measure_memory(build) -> (object, int, int):
+    """
+    Run build() under tracemalloc and return its result,
+    the bytes still allocated afterwards and the peak bytes
+    """
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def _timed(func) -> float:
+    """
+    Return wall-clock seconds taken by func()
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_typed_memory(n: int = 500_000) -> None:
+    """
+    Compare memory used by object and typed DynamicArray storage
+    """
+    print(f"\n# typed_memory: {n} elements")
+    for typecode, make in ((None, int), ('q', int), (None, float), ('d', float)):
+        def build():
+            da = DynamicArray(typecode=typecode)
+            for i in range(n):
+                da.append(make(i) + n)
+            return da
+
+        da, current, peak = _measure_memory(build)
+        label = typecode or 'object'
+        print(f"{make.__name__:>5} {label:>6}: {current / 2 ** 20:7.1f} MiB retained "
+              f"({current / n:5.1f} bytes/element), peak {peak / 2 ** 20:7.1f} MiB, "
+              f"capacity {da.get_capacity()}")
+
+
+def bench_bulk_build(n: int = 1_000_000) -> None:
+    """
+    Compare building an array with append() against extend()/from_iterable()
+    """
+    print(f"\n# bulk_build: {n} elements")
+    values = list(range(n))
+
+    def append_loop():
+        da = DynamicArray()
+        for value in values:
+            da.append(value)
+
+    def merge_arrays():
+        da = DynamicArray(values)
+        da.merge(da)
+
+    cases = (
+        ("append() loop", append_loop),
+        ("DynamicArray(list)", lambda: DynamicArray(values)),
+        ("from_iterable(generator)", lambda: DynamicArray.from_iterable(iter(values))),
+        ("from_iterable(generator, size_hint)",
+         lambda: DynamicArray.from_iterable(iter(values), size_hint=n)),
+        ("from_iterable(list, typecode='q')", lambda: DynamicArray.from_iterable(values, typecode='q')),
+        ("DynamicArray(list) + merge(self)", merge_arrays),
+    )
+    for label, build in cases:
+        print(f"{label:>38}: {_timed(build):6.3f} s")
+
+
+def bench_numpy_backend(n: int = 1_000_000) -> None:
+    """
+    Compare per-element and NumPy-vectorized map/filter/reduce on typed arrays
+    """
+    print(f"\n# numpy_backend: {n} elements")
+    if not numpy_backend.available():
+        print("NumPy is not installed, skipping")
+        return
+
+    numpy = numpy_backend.numpy
+    da = DynamicArray.from_iterable(range(n), typecode='d')
+    ints = DynamicArray.from_iterable(range(n), typecode='q')
+    cases = (
+        ("map sqrt", lambda: da.map(lambda x: x ** 0.5), lambda: da.map(numpy.sqrt)),
+        ("filter > n/2", lambda: da.filter(lambda x: x > n / 2),
+         lambda: da.filter(lambda x: x > n / 2, vectorized=True)),
+        ("reduce max", lambda: da.reduce(lambda x, y: max(x, y)), lambda: da.reduce(max)),
+        #float sums stay on the loop since NumPy rounds them differently, so integers are summed
+        ("reduce add", lambda: ints.reduce(lambda x, y: x + y), lambda: ints.reduce(operator.add)),
+    )
+    for label, python_path, numpy_path in cases:
+        slow, fast = _timed(python_path), _timed(numpy_path)
+        print(f"{label:>14}: python {slow:6.3f} s, numpy {fast:6.4f} s ({slow / fast:6.1f}x)")
+
+
+def _score(value: int) -> int:
+    """
+    CPU-heavy map function used by the parallel benchmark
+    """
+    total = 0
+    for i in range(200):
+        total = (total * 31 + value * i) % 1_000_003
+    return total
+
+
+def _keep(value: int) -> bool:
+    """
+    CPU-heavy filter predicate used by the parallel benchmark
+    """
+    return _score(value) % 2 == 0
+
+
+def bench_parallel(n: int = 50_000) -> None:
+    """
+    Show how parallel map/filter/reduce scale with the number of worker processes
+    """
+    print(f"\n# parallel: {n} elements, {os.cpu_count()} CPUs")
+    da = DynamicArray.from_iterable(range(n))
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        mapped = _timed(lambda: da.map(_score, workers=workers))
+        kept = _timed(lambda: da.filter(_keep, workers=workers))
+        reduced = _timed(lambda: da.reduce(operator.add, workers=workers))
+        print(f"{workers:>3} workers: map {mapped:6.3f} s, filter {kept:6.3f} s, reduce {reduced:6.3f} s")
+
+
+def bench_lazy_pipeline(n: int = 1_000_000) -> None:
+    """
+    Compare an eager map/filter/reduce chain with the fused lazy pipeline
+    """
+    print(f"\n# lazy_pipeline: {n} elements")
+    da = DynamicArray.from_iterable(range(n))
+
+    def square(x):
+        return x * x
+
+    def is_even(x):
+        return x % 2 == 0
+
+    eager = _timed(lambda: da.map(square).filter(is_even).reduce(operator.add))
+    lazy = _timed(lambda: da.lazy().map(square).filter(is_even).reduce(operator.add))
+    print(f"eager {eager:6.3f} s, lazy {lazy:6.3f} s")
+
+
+def _cursor_edits(arr, edits: int, seed: int = 7) -> None:
+    """
+    Editor-like workload: insert and delete around a slowly moving cursor
+    """
+    rng = random.Random(seed)
+    cursor = arr.length() // 2
+    for _ in range(edits):
+        cursor = min(max(cursor + rng.randint(-3, 3), 0), arr.length() - 1)
+        if rng.random() < 0.6:
+            arr.insert_at_index(cursor, 'x')
+            cursor += 1
+        else:
+            arr.remove_at_index(cursor)
+
+
+def bench_gap_buffer(n: int = 50_000, edits: int = 1_000) -> None:
+    """
+    Compare DynamicArray and GapBufferArray on clustered edits
+    """
+    print(f"\n# gap_buffer: {n} elements, {edits} edits near a moving cursor")
+    for cls in (DynamicArray, GapBufferArray):
+        arr = cls(range(n))
+        print(f"{cls.__name__:>15}: {_timed(lambda: _cursor_edits(arr, edits)):6.3f} s")
+
+
+def bench_random_edits(n: int = 50_000, edits: int = 1_000) -> None:
+    """
+    Compare array variants on inserts and removals at random positions
+    """
+    print(f"\n# random_edits: {n} elements, {edits} edits at random positions")
+
+    def edit(arr):
+        rng = random.Random(11)
+        for _ in range(edits):
+            if rng.random() < 0.5:
+                arr.insert_at_index(rng.randint(0, arr.length()), 'x')
+            else:
+                arr.remove_at_index(rng.randrange(arr.length()))
+
+    for cls in (DynamicArray, GapBufferArray, TieredArray):
+        arr = cls(range(n))
+        print(f"{cls.__name__:>15}: {_timed(lambda: edit(arr)):6.3f} s")
+
+
+class _SelfIteratingArray(DynamicArray):
+    """
+    DynamicArray with the former self-iterating, exception-driven loop protocol
+    """
+
+    def __iter__(self):
+        self._index = 0
+        return self
+
+    def __next__(self):
+        try:
+            value = self[self._index]
+        except DynamicArrayException:
+            raise StopIteration
+        self._index += 1
+        return value
+
+
+def bench_iteration(n: int = 1_000_000) -> None:
+    """
+    Compare loop throughput of the iterator objects with the former protocol
+    """
+    print(f"\n# iteration: {n} elements")
+
+    def consume(values):
+        for _ in values:
+            pass
+
+    old = _SelfIteratingArray(range(n))
+    new = DynamicArray(range(n))
+    cases = (
+        ("former self-iterator", lambda: consume(old)),
+        ("index loop da[i]", lambda: consume(new[i] for i in range(n))),
+        ("DynamicArrayIterator", lambda: consume(new)),
+        ("reversed()", lambda: consume(reversed(new))),
+    )
+    for label, loop in cases:
+        seconds = _timed(loop)
+        print(f"{label:>22}: {seconds:6.3f} s ({n / seconds / 1e6:5.2f} M values/s)")
+
+
+def bench_sort(n: int = 50_000) -> None:
+    """
+    Compare DynamicArray.sort (merge and radix paths) with min_heap.heapsort
+    """
+    print(f"\n# sort: {n} elements")
+    rng = random.Random(3)
+    shuffled = [rng.randrange(10 ** 9) for _ in range(n)]
+    ordered = sorted(shuffled)
+    nearly = list(ordered)
+    for _ in range(n // 100):
+        i, j = rng.randrange(n), rng.randrange(n)
+        nearly[i], nearly[j] = nearly[j], nearly[i]
+
+    for label, values in (("random", shuffled), ("sorted", ordered), ("nearly sorted", nearly)):
+        times = []
+        for typecode, sorter in ((None, heapsort), (None, DynamicArray.sort), ('q', DynamicArray.sort)):
+            da = DynamicArray(values, typecode=typecode)
+            times.append(_timed(lambda: sorter(da)))
+        print(f"{label:>14}: heapsort {times[0]:6.3f} s, sort() {times[1]:6.3f} s, "
+              f"typed sort() {times[2]:6.3f} s")
+
+
+def bench_batch_remove(n: int = 20_000, k: int = 1_000) -> None:
+    """
+    Compare removing k elements one by one with remove_many()/remove_if()
+    """
+    print(f"\n# batch_remove: remove {k} of {n} elements")
+    doomed = random.Random(5).sample(range(n), k)
+    marked = set(doomed)
+
+    def one_by_one():
+        da = DynamicArray(range(n))
+        for index in sorted(doomed, reverse=True):
+            da.remove_at_index(index)
+
+    cases = (
+        ("remove_at_index() loop", one_by_one),
+        ("remove_many()", lambda: DynamicArray(range(n)).remove_many(doomed)),
+        ("remove_if()", lambda: DynamicArray(range(n)).remove_if(lambda x: x in marked)),
+    )
+    for label, remove in cases:
+        print(f"{label:>22}: {_timed(remove):6.3f} s")
+
+
+def bench_mmap_array(n: int = 1_000_000) -> None:
+    """
+    Compare building, reopening and scanning a file-backed array with an in-memory one
+    """
+    print(f"\n# mmap_array: {n} 'q' elements")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'bench.dam')
+
+        def build_file():
+            with MmapDynamicArray(path, 'q') as ma:
+                ma.extend(range(n))
+
+        def scan_file():
+            with MmapDynamicArray(path) as ma:
+                total = sum(sum(chunk) for chunk in ma.iter_chunks())
+            assert total == n * (n - 1) // 2
+
+        cases = (
+            ("in-memory extend()", lambda: DynamicArray(range(n), typecode='q')),
+            ("file extend()", build_file),
+            ("file reopen", lambda: MmapDynamicArray(path).close()),
+            ("file iter_chunks() sum", scan_file),
+        )
+        for label, run in cases:
+            print(f"{label:>24}: {_timed(run):6.3f} s")
+
+
+def bench_save_load(n: int = 1_000_000) -> None:
+    """
+    Compare save()/load() with writing and reading the values one by one
+    """
+    print(f"\n# save_load: {n} elements")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'bench.bin')
+        for typecode in ('q', None):
+            da = DynamicArray(range(n), typecode=typecode)
+
+            def write_each():
+                with open(path, 'w') as file:
+                    for value in da:
+                        file.write(f"{value}\n")
+
+            def read_each():
+                with open(path) as file:
+                    return DynamicArray((int(line) for line in file), typecode=typecode)
+
+            label = typecode or 'object'
+            print(f"{label:>6} per-element write: {_timed(write_each):6.3f} s, "
+                  f"read: {_timed(read_each):6.3f} s, file {os.path.getsize(path)} bytes")
+            print(f"{label:>6}          save(): {_timed(lambda: da.save(path)):6.3f} s, "
+                  f"load(): {_timed(lambda: DynamicArray.load(path)):6.3f} s, file {os.path.getsize(path)} bytes")
+            loaded, current, peak = _measure_memory(lambda: DynamicArray.load(path))
+            print(f"{label:>6}   load() memory: {current / 2 ** 20:7.1f} MiB retained, peak {peak / 2 ** 20:7.1f} MiB")
+
+
+def bench_snapshot(n: int = 200_000, rounds: int = 20) -> None:
+    """
+    Compare snapshot() with copying the array by slice() while a writer appends and updates
+    """
+    print(f"\n# snapshot: {rounds} consistent reads of a growing {n} element array")
+    for label, take in (("slice(0, length())", lambda da: da.slice(0, da.length())),
+                        ("snapshot()", lambda da: da.snapshot())):
+        da = DynamicArray(range(n), typecode='q')
+
+        def run():
+            for i in range(rounds):
+                frozen = take(da)
+                da.append(i)
+                da[i * 997 % n] = -i
+                frozen[frozen.length() - 1]
+
+        print(f"{label:>20}: {_timed(run):6.3f} s")
+
+
+def bench_buffer_export(n: int = 1_000_000) -> None:
+    """
+    Compare handing typed array contents to NumPy and bytes by copying values with memoryview()
+    """
+    print(f"\n# buffer_export: {n} 'd' elements")
+    da = DynamicArray(range(n), typecode='d')
+    cases = [
+        ("bytes from values", lambda: b''.join(struct.pack('d', value) for value in da)),
+        ("bytes(memoryview())", lambda: bytes(da.memoryview())),
+    ]
+    if numpy_backend.available():
+        numpy = numpy_backend.numpy
+        cases += [
+            ("numpy.array(list(values))", lambda: numpy.array(list(da))),
+            ("numpy.asarray(memoryview())", lambda: numpy.asarray(da.memoryview())),
+        ]
+    for label, export in cases:
+        print(f"{label:>28}: {_timed(export):6.3f} s")
+
+
+def _break_even(build: float, indexed: float, linear: float) -> str:
+    """
+    Return after how many operations an index that took build seconds to
+    create and indexed seconds per operation beats linear seconds per operation
+    """
+    if indexed >= linear:
+        return "never"
+    return str(int(build / (linear - indexed)) + 1)
+
+
+def bench_fenwick(n: int = 200_000, queries: int = 5_000, window: int = 10_000) -> None:
+    """
+    Compare window sums by slice().reduce() with a FenwickIndex, while values are updated
+
+    The index costs an O(n) build before its first query, so build time and
+    per-operation time are reported apart, with the number of operations
+    after which the index comes out ahead.
+    """
+    print(f"\n# fenwick: {queries} updates and {window} element window sums over {n} elements")
+    rng = random.Random(11)
+    starts = [rng.randrange(n - window) for _ in range(queries)]
+    da = DynamicArray(range(n), typecode='q')
+
+    def by_slice():
+        for i, lo in enumerate(starts):
+            da[lo] = i
+            da.slice(lo, window).reduce(operator.add)
+
+    index = FenwickIndex(da)
+    build = _timed(index.rebuild)
+
+    def by_index():
+        for i, lo in enumerate(starts):
+            da[lo] = i
+            index.range_sum(lo, lo + window)
+
+    indexed = _timed(by_index) / queries
+    index.detach()
+    linear = _timed(by_slice) / queries
+    print(f"{'slice().reduce()':>18}: {linear * 1e6:8.1f} us per update + sum")
+    print(f"{'FenwickIndex':>18}: {indexed * 1e6:8.1f} us per update + sum, build {build:6.3f} s")
+    print(f"{'break-even':>18}: {_break_even(build, indexed, linear)} operations")
+
+
+def bench_range_query(n: int = 100_000, queries: int = 5_000) -> None:
+    """
+    Compare range-min queries by slice().reduce() with a SegmentTree and a SparseTable
+
+    Build time and per-query time are reported apart, with the number of
+    queries after which each structure comes out ahead of the linear scan.
+    """
+    print(f"\n# range_query: {queries} range-min queries over {n} elements")
+    rng = random.Random(13)
+    da = DynamicArray((rng.randrange(10 ** 9) for _ in range(n)), typecode='q')
+    ranges = [sorted(rng.sample(range(n + 1), 2)) for _ in range(queries)]
+    ranges = [(lo, hi) for lo, hi in ranges if hi > lo]
+
+    start = time.perf_counter()
+    expected = [da.slice(lo, hi - lo).reduce(min) for lo, hi in ranges]
+    linear = (time.perf_counter() - start) / len(ranges)
+    print(f"{'slice().reduce()':>18}: {linear * 1e6:8.1f} us per query")
+
+    for label, make in (("SegmentTree", lambda: SegmentTree(da, min, float('inf'))),
+                        ("SparseTable", lambda: SparseTable(da, min))):
+        index = make()
+        build = _timed(index.rebuild)
+        start = time.perf_counter()
+        result = [index.query(lo, hi) for lo, hi in ranges]
+        indexed = (time.perf_counter() - start) / len(ranges)
+        assert result == expected
+        index.detach()
+        print(f"{label:>18}: {indexed * 1e6:8.1f} us per query, build {build:6.3f} s, "
+              f"break-even after {_break_even(build, indexed, linear)} queries")
+
+
+def bench_resize(n: int = 1_000_000) -> None:
+    """
+    Compare one resize of an n element array copied element by element with copy_range()
+    """
+    print(f"\n# resize: doubling the capacity of {n} elements")
+    for typecode in (None, 'q'):
+        da = DynamicArray(range(n), typecode=typecode)
+
+        def element_loop():
+            new_arr = da._new_storage(2 * n)
+            for i in range(n):
+                new_arr[i] = da._data[i]
+
+        def block_copy():
+            copy_range(da._data, 0, da._new_storage(2 * n), 0, n)
+
+        label = typecode or 'object'
+        for name, run in (("element loop", element_loop), ("copy_range()", block_copy),
+                          ("resize()", lambda: da.resize(da.get_capacity() * 2))):
+            print(f"{label:>6} {name:>12}: {_timed(run):6.3f} s")
+
+
+def bench_pool(rounds: int = 200, n: int = 5_000) -> None:
+    """
+    Compare append/remove churn and queue doubling with and without a StaticArrayPool
+    """
+    print(f"\n# pool: {rounds} rounds of growing to {n} elements and shrinking back")
+    for label, pool in (("no pool", None), ("StaticArrayPool", StaticArrayPool())):
+        def churn():
+            da = DynamicArray(pool=pool)
+            for _ in range(rounds):
+                for i in range(n):
+                    da.append(i)
+                for _ in range(n):
+                    da.remove_at_index(da.length() - 1)
+
+        def queues():
+            for _ in range(rounds):
+                q = Queue(pool=pool)
+                for i in range(n):
+                    q.enqueue(i)
+
+        print(f"{label:>16}: churn {_timed(churn):6.3f} s, queues {_timed(queues):6.3f} s")
+        if pool is not None:
+            print(f"{'':>16}  {pool}")
+
+
+class _CheckedArray(DynamicArray):
+    """
+    DynamicArray whose internal accessors go through the checked public indexing,
+    standing in for the structures before the unchecked fast path
+    """
+    _get_unchecked = DynamicArray.get_at_index
+    _set_unchecked = DynamicArray.set_at_index
+
+
+def bench_unchecked_access(n: int = 200_000) -> None:
+    """
+    Compare checked public indexing with the internal unchecked accessors
+    """
+    print(f"\n# unchecked_access: {n} elements")
+    da = DynamicArray(range(n))
+    rounds = range(n)
+
+    def checked_get():
+        for i in rounds:
+            da.get_at_index(i)
+
+    def unchecked_get():
+        get = da._get_unchecked
+        for i in rounds:
+            get(i)
+
+    def checked_set():
+        for i in rounds:
+            da.set_at_index(i, i)
+
+    def unchecked_set():
+        put = da._set_unchecked
+        for i in rounds:
+            put(i, i)
+
+    for name, run in (("checked get", checked_get), ("unchecked get", unchecked_get),
+                      ("checked set", checked_set), ("unchecked set", unchecked_set)):
+        print(f"{name:>14}: {_timed(run) / n * 1e9:6.1f} ns per access")
+
+    values = [random.random() for _ in range(n)]
+    for label, cls in (("checked", _CheckedArray), ("unchecked", DynamicArray)):
+        def sift():
+            heapsort(cls(values))
+
+        def heap_ops():
+            heap = MinHeap()
+            heap._heap = cls()
+            for value in values[:n // 4]:
+                heap.add(value)
+            while not heap.is_empty():
+                heap.remove_min()
+
+        print(f"{label:>14}: heapsort {_timed(sift):6.3f} s, add/remove_min {_timed(heap_ops):6.3f} s")
+
+    def appends():
+        grown = DynamicArray()
+        for i in rounds:
+            grown.append(i)
+
+    def inserts():
+        front = DynamicArray()
+        for i in range(n // 20):
+            front.insert_at_index(i // 2, i)
+
+    print(f"{'append':>14}: {_timed(appends) / n * 1e9:6.1f} ns per call including resizes")
+    print(f"{'insert':>14}: {_timed(inserts) / (n // 20) * 1e9:6.1f} ns per call")
+
+
+def bench_node_memory(n: int = 50_000) -> None:
+    """
+    Compare bytes per element of the linked and tree structures with their default and compact nodes
+    """
+    print(f"\n# node_memory: {n} elements")
+    values = list(range(n))
+    random.Random(3).shuffle(values)
+    keys = ['key' + str(i) for i in range(n)]
+    queued = min(n, 2_000)
+
+    def fill_list(node_type):
+        lst = LinkedList(node_type=node_type)
+        for value in values:
+            lst.insert_front(value)
+        return lst
+
+    def fill_stack(node_type):
+        stack = LinkedStack(node_type)
+        for value in values:
+            stack.push(value)
+        return stack
+
+    def fill_queue(node_type):
+        #enqueue() walks the queue to find its size, so fewer values are used
+        queue = LinkedQueue(node_type)
+        for value in values[:queued]:
+            queue.enqueue(value)
+        return queue
+
+    def fill_chaining(node_type):
+        m = ChainingMap(n, hash, node_type)
+        for key in keys:
+            m.put(key, 0)
+        return m
+
+    def fill_open_addressing(entry_type):
+        m = OpenAddressingMap(2 * n, hash, entry_type)
+        for key in keys:
+            m.put(key, 0)
+        return m
+
+    def fill_bst(node_type):
+        return BST(values, node_type)
+
+    def fill_avl(node_type):
+        return AVL(values, node_type)
+
+    cases = (
+        ("LinkedList", fill_list, n, SLNode, CompactSLNode),
+        ("Stack", fill_stack, n, SLNode, CompactSLNode),
+        ("Queue", fill_queue, queued, SLNode, CompactSLNode),
+        ("HashMap (SC)", fill_chaining, n, ChainNode, CompactChainNode),
+        ("HashMap (OA)", fill_open_addressing, n, HashEntry, CompactHashEntry),
+        ("BST", fill_bst, n, BSTNode, CompactBSTNode),
+        ("AVL", fill_avl, n, AVLNode, CompactAVLNode),
+    )
+    for label, fill, count, default, compact in cases:
+        out = f"{label:>13}:"
+        for node_type in (default, compact):
+            _, current, _ = _measure_memory(lambda: fill(node_type))
+            out += f" {node_type.__name__:>16} {current / count:6.1f} B/element"
+        print(out)
+
+
+def bench_pooled_tree(n: int = 50_000) -> None:
+    """
+    Compare memory and speed of the node-object trees with the struct-of-arrays trees
+    """
+    print(f"\n# pooled_tree: {n} random keys")
+    values = list(range(n))
+    random.Random(5).shuffle(values)
+    cases = (
+        ("BST", lambda: BST(values)),
+        ("BST compact", lambda: BST(values, CompactBSTNode)),
+        ("PooledBST", lambda: PooledBST(values)),
+        ("PooledBST 'q'", lambda: PooledBST(values, typecode='q')),
+        ("AVL", lambda: AVL(values)),
+        ("AVL compact", lambda: AVL(values, CompactAVLNode)),
+        ("PooledAVL", lambda: PooledAVL(values)),
+        ("PooledAVL 'q'", lambda: PooledAVL(values, typecode='q')),
+    )
+    for label, build in cases:
+        tree, current, _ = _measure_memory(build)
+        built = _timed(build)
+
+        def lookups():
+            for value in values:
+                tree.contains(value)
+
+        def removes():
+            for value in values[:n // 2]:
+                tree.remove(value)
+
+        print(f"{label:>14}: {current / n:6.1f} B/element, add {built:6.3f} s, "
+              f"contains {_timed(lookups):6.3f} s, remove half {_timed(removes):6.3f} s")
+
+
+BENCHMARKS = {
+    'typed_memory': bench_typed_memory,
+    'bulk_build': bench_bulk_build,
+    'numpy_backend': bench_numpy_backend,
+    'parallel': bench_parallel,
+    'lazy_pipeline': bench_lazy_pipeline,
+    'gap_buffer': bench_gap_buffer,
+    'random_edits': bench_random_edits,
+    'iteration': bench_iteration,
+    'sort': bench_sort,
+    'batch_remove': bench_batch_remove,
+    'mmap_array': bench_mmap_array,
+    'save_load': bench_save_load,
+    'snapshot': bench_snapshot,
+    'buffer_export': bench_buffer_export,
+    'fenwick': bench_fenwick,
+    'range_query': bench_range_query,
+    'resize': bench_resize,
+    'pool': bench_pool,
+    'unchecked_access': bench_unchecked_access,
+    'node_memory': bench_node_memory,
+    'pooled_tree': bench_pooled_tree,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
@@ -27,10 +27,12 @@ class BST:
     Binary Search Tree class
     """
 
-    def __init__(self, start_tree=None) -> None:
+    def __init__(self, start_tree=None, node_type=BSTNode) -> None:
         """
         Initialize new Binary Search Tree
+        node_type builds the nodes, e.g. compact_nodes.CompactBSTNode
         """
+        self._node_type = node_type
         self._root = None
 
         # populate BST with initial values (if provided)
@@ -101,7 +103,7 @@ class BST:
         """
 
         #creates a new node
-        new_node = BSTNode(value)
+        new_node = self._node_type(value)
 
         #if no objects in tree
         if self._root is None:
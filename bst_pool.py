@@ -0,0 +1,659 @@
+from dynamic_array import DynamicArray
+from queue_and_stack import Queue, Stack
+
+
+# node ids index the parallel arrays; _NIL marks a missing child or parent
+_NIL = -1
+# 4-byte links hold up to 2 ** 31 - 1 node ids
+_LINK_TYPECODE = 'i'
+# AVL heights stay below 1.45 * log2(n + 2), far inside a signed byte
+_HEIGHT_TYPECODE = 'b'
+
+
+class PooledBST:
+    """
+    Binary Search Tree stored as a struct of arrays instead of node objects
+
+    Node i has its value in _values[i] and the ids of its children and
+    parent in the typed arrays _left[i], _right[i] and _parent[i], so a
+    node costs 12 bytes of links plus its value instead of a Python
+    object per node, and the garbage collector has no nodes to traverse.
+    Pass a typecode such as 'q' or 'd' to keep numeric values unboxed too.
+    Removed nodes go on a freelist threaded through _left and their ids
+    are reused by later adds. Duplicates are added to the right, as in BST.
+    """
+
+    def __init__(self, start_tree=None, typecode=None) -> None:
+        """
+        Initialize new tree, with values stored in a typed array if typecode is given
+        """
+        self._typecode = typecode
+        self.make_empty()
+
+        # populate tree with initial values (if provided)
+        if start_tree is not None:
+            for value in start_tree:
+                self.add(value)
+
+    def __str__(self) -> str:
+        """
+        Override string method; display in pre-order
+        """
+        return "BST pre-order { " + ", ".join(self._preorder()) + " }"
+
+    def _preorder(self) -> []:
+        """
+        Helper method for __str__. Returns the values as strings in pre-order
+        """
+        values = []
+        get_value = self._values._get_unchecked
+        get_left = self._left._get_unchecked
+        get_right = self._right._get_unchecked
+        stack = Stack()
+        stack.push(self._root)
+        while not stack.is_empty():
+            node = stack.pop()
+            if node != _NIL:
+                values.append(str(get_value(node)))
+                stack.push(get_right(node))
+                stack.push(get_left(node))
+        return values
+
+    def _buffers(self) -> tuple:
+        """
+        Returns the raw value, left and right buffers for loops that only read;
+        they are replaced whenever an array grows
+        """
+        return self._values._data._data, self._left._data._data, self._right._data._data
+
+    def _new_arrays(self) -> None:
+        """
+        Creates the empty parallel arrays
+        """
+        self._values = DynamicArray(typecode=self._typecode)
+        self._left = DynamicArray(typecode=_LINK_TYPECODE)
+        self._right = DynamicArray(typecode=_LINK_TYPECODE)
+        self._parent = DynamicArray(typecode=_LINK_TYPECODE)
+
+    def _allocate(self, value: object, parent: int) -> int:
+        """
+        Returns the id of a new leaf holding value, reusing a freed id if there is one
+        """
+        node = self._free
+        if node == _NIL:
+            #stores the value first so a value rejected by typed storage leaves the tree unchanged
+            self._values.append(value)
+            self._left.append(_NIL)
+            self._right.append(_NIL)
+            self._parent.append(parent)
+            return self._values.length() - 1
+
+        self._values._set_unchecked(node, value)
+        self._free = self._left._get_unchecked(node)
+        self._free_count -= 1
+        self._left._set_unchecked(node, _NIL)
+        self._right._set_unchecked(node, _NIL)
+        self._parent._set_unchecked(node, parent)
+        return node
+
+    def _release(self, node: int) -> None:
+        """
+        Puts node on the freelist
+        """
+        #clears object values so freed nodes keep nothing alive
+        if self._typecode is None:
+            self._values._set_unchecked(node, None)
+        self._left._set_unchecked(node, self._free)
+        self._right._set_unchecked(node, _NIL)
+        self._parent._set_unchecked(node, _NIL)
+        self._free = node
+        self._free_count += 1
+
+    def _replace_child(self, parent: int, old: int, new: int) -> None:
+        """
+        Links new where old hung below parent (or as the root)
+        """
+        if parent == _NIL:
+            self._root = new
+        elif self._left._get_unchecked(parent) == old:
+            self._left._set_unchecked(parent, new)
+        else:
+            self._right._set_unchecked(parent, new)
+        if new != _NIL:
+            self._parent._set_unchecked(new, parent)
+
+    def _find(self, value: object) -> int:
+        """
+        Returns the id of the first node from the root holding value, or _NIL
+        """
+        #nothing is allocated while searching, so the raw buffers stay valid
+        values, left, right = self._buffers()
+        node = self._root
+        while node != _NIL:
+            current = values[node]
+            if current == value:
+                return node
+            node = left[node] if value < current else right[node]
+        return _NIL
+
+    def _unlink(self, node: int) -> int:
+        """
+        Takes node out of the tree, replacing it by its inorder successor if it has two children
+
+        Returns:
+        the lowest node whose subtree changed (_NIL if none)
+        """
+        get_left = self._left._get_unchecked
+        get_right = self._right._get_unchecked
+        left = get_left(node)
+        right = get_right(node)
+        parent = self._parent._get_unchecked(node)
+
+        #no or one subtree: the child (if any) takes the node's place
+        if left == _NIL or right == _NIL:
+            self._replace_child(parent, node, left if right == _NIL else right)
+            return parent
+
+        #two subtrees: the inorder successor takes the node's place
+        successor_parent = node
+        successor = right
+        while get_left(successor) != _NIL:
+            successor_parent = successor
+            successor = get_left(successor)
+
+        self._left._set_unchecked(successor, left)
+        self._parent._set_unchecked(left, successor)
+
+        if successor != right:
+            successor_right = get_right(successor)
+            self._left._set_unchecked(successor_parent, successor_right)
+            if successor_right != _NIL:
+                self._parent._set_unchecked(successor_right, successor_parent)
+            self._right._set_unchecked(successor, right)
+            self._parent._set_unchecked(right, successor)
+
+        self._replace_child(parent, node, successor)
+        self._take_place(successor, node)
+        return successor if successor_parent == node else successor_parent
+
+    def _take_place(self, successor: int, node: int) -> None:
+        """
+        Called after successor replaced node in the tree; nothing beyond the links to copy
+        """
+        pass
+
+    # ------------------------------------------------------------------ #
+
+    def add(self, value: object) -> None:
+        """
+        adds an object to the tree
+
+        parameters:
+        an object
+
+        returns:
+        nothing
+        """
+        if self._root == _NIL:
+            self._root = self._allocate(value, _NIL)
+            return
+
+        values, left, right = self._buffers()
+
+        #find right spot
+        parent = _NIL
+        node = self._root
+        while node != _NIL:
+            parent = node
+            node = left[node] if value < values[node] else right[node]
+
+        goes_left = value < values[parent]
+        node = self._allocate(value, parent)
+        if goes_left:
+            self._left._set_unchecked(parent, node)
+        else:
+            self._right._set_unchecked(parent, node)
+
+    def remove(self, value: object) -> bool:
+        """
+        removes an object from the tree and frees its node
+
+        parameters:
+        a value
+
+        returns:
+        a bool if something was removed
+        """
+        node = self._find(value)
+        if node == _NIL:
+            return False
+
+        self._unlink(node)
+        self._release(node)
+        return True
+
+    def contains(self, value: object) -> bool:
+        """
+        checks if a value is in the tree
+
+        parameters:
+        a value
+
+        returns:
+        a bool if it was found
+        """
+        return self._find(value) != _NIL
+
+    def inorder_traversal(self) -> Queue:
+        """
+        gives the inorder traversal results for the tree
+
+        Follows the parent links instead of recursing, so degenerate
+        trees of any depth are traversed without a stack.
+
+        parameters:
+        just self
+
+        returns:
+        a Queue filled with the inorder traversal
+        """
+        result = Queue()
+        values, left, right = self._buffers()
+        parents = self._parent._data._data
+
+        node = self._root
+        if node == _NIL:
+            return result
+        while left[node] != _NIL:
+            node = left[node]
+
+        while node != _NIL:
+            result.enqueue(values[node])
+            if right[node] != _NIL:
+                #next is the leftmost node of the right subtree
+                node = right[node]
+                while left[node] != _NIL:
+                    node = left[node]
+            else:
+                #next is the first ancestor reached from its left subtree
+                child = node
+                node = parents[node]
+                while node != _NIL and right[node] == child:
+                    child = node
+                    node = parents[node]
+
+        return result
+
+    def find_min(self) -> object:
+        """
+        finds the minimum value in the tree
+
+        parameters:
+        just self
+
+        returns:
+        min value
+        """
+        if self._root == _NIL:
+            return None
+
+        node = self._root
+        while self._left._get_unchecked(node) != _NIL:
+            node = self._left._get_unchecked(node)
+        return self._values._get_unchecked(node)
+
+    def find_max(self) -> object:
+        """
+        finds the maximum value in the tree
+
+        parameters:
+        just self
+
+        returns:
+        max value
+        """
+        if self._root == _NIL:
+            return None
+
+        node = self._root
+        while self._right._get_unchecked(node) != _NIL:
+            node = self._right._get_unchecked(node)
+        return self._values._get_unchecked(node)
+
+    def is_empty(self) -> bool:
+        """
+        checks if the tree is empty
+
+        parameters:
+        just self
+
+        returns:
+        bool if empty or not
+        """
+        return self._root == _NIL
+
+    def make_empty(self) -> None:
+        """
+        makes the tree empty and drops its arrays
+
+        parameters:
+        just self
+
+        returns:
+        nothing
+        """
+        self._new_arrays()
+        self._root = _NIL
+        self._free = _NIL
+        self._free_count = 0
+
+    def size(self) -> int:
+        """
+        returns the number of values in the tree
+
+        parameters:
+        just self
+
+        returns:
+        an int
+        """
+        return self._values.length() - self._free_count
+
+    def get_free_count(self) -> int:
+        """
+        returns the number of freed node ids waiting to be reused
+
+        parameters:
+        just self
+
+        returns:
+        an int
+        """
+        return self._free_count
+
+    def is_valid(self) -> bool:
+        """
+        Perform pre-order traversal of the tree.
+        Return False if values break the ordering property or
+        parent and child links are out of sync.
+        """
+        get_value = self._values._get_unchecked
+        get_left = self._left._get_unchecked
+        get_right = self._right._get_unchecked
+        get_parent = self._parent._get_unchecked
+        if self._root != _NIL and get_parent(self._root) != _NIL:
+            return False
+
+        stack = Stack()
+        stack.push(self._root)
+        while not stack.is_empty():
+            node = stack.pop()
+            if node != _NIL:
+                left = get_left(node)
+                right = get_right(node)
+                if left != _NIL and (get_value(left) >= get_value(node) or get_parent(left) != node):
+                    return False
+                if right != _NIL and (get_value(right) < get_value(node) or get_parent(right) != node):
+                    return False
+                stack.push(right)
+                stack.push(left)
+        return True
+
+
+class PooledAVL(PooledBST):
+    """
+    AVL Tree stored as a struct of arrays. Inherits from PooledBST
+
+    Adds a typed array of node heights and rebalances after add() and
+    remove() with the same balancing rules and rotations as AVL.
+    Rebalancing stops at the first ancestor whose height did not change.
+    Duplicates are ignored. The trees differ once AVL's root has been
+    removed: avl.AVL leaves the new root's parent link pointing at the
+    removed node, and later rebalancing can link that node back in, e.g.
+    AVL((5, 3)), remove(5), add(5) gives { 5, 3, 5 } where PooledAVL
+    gives { 3, 5 }.
+    """
+
+    def __str__(self) -> str:
+        """
+        Override string method; display in pre-order
+        """
+        return "AVL pre-order { " + ", ".join(self._preorder()) + " }"
+
+    def _new_arrays(self) -> None:
+        """
+        Creates the empty parallel arrays, including the heights
+        """
+        super()._new_arrays()
+        self._height = DynamicArray(typecode=_HEIGHT_TYPECODE)
+
+    def _allocate(self, value: object, parent: int) -> int:
+        """
+        Returns the id of a new leaf of height 0
+        """
+        node = super()._allocate(value, parent)
+        if node == self._height.length():
+            self._height.append(0)
+        else:
+            self._height._set_unchecked(node, 0)
+        return node
+
+    def _take_place(self, successor: int, node: int) -> None:
+        """
+        Gives successor the height of the node it replaced, so rebalancing
+        compares against the height that subtree had before the removal
+        """
+        self._height._set_unchecked(successor, self._height._get_unchecked(node))
+
+    def _get_height(self, node: int) -> int:
+        """
+        Returns the height of a node (-1 for _NIL)
+        """
+        if node == _NIL:
+            return -1
+        return self._height._get_unchecked(node)
+
+    def _update_height(self, node: int) -> None:
+        """
+        Sets the height of a node from its children
+        """
+        self._height._set_unchecked(node, max(self._get_height(self._left._get_unchecked(node)),
+                                              self._get_height(self._right._get_unchecked(node))) + 1)
+
+    def _balance_factor(self, node: int) -> int:
+        """
+        Returns the height of the right subtree minus the height of the left one
+        """
+        return self._get_height(self._right._get_unchecked(node)) - self._get_height(self._left._get_unchecked(node))
+
+    def _rotate_left(self, node: int) -> int:
+        """
+        rotates a node and its subtrees left and returns the new subtree root
+        """
+        c = self._right._get_unchecked(node)
+        inner = self._left._get_unchecked(c)
+        self._right._set_unchecked(node, inner)
+        if inner != _NIL:
+            self._parent._set_unchecked(inner, node)
+        self._replace_child(self._parent._get_unchecked(node), node, c)
+        self._left._set_unchecked(c, node)
+        self._parent._set_unchecked(node, c)
+        self._update_height(node)
+        self._update_height(c)
+        return c
+
+    def _rotate_right(self, node: int) -> int:
+        """
+        rotates a node and its subtrees right and returns the new subtree root
+        """
+        c = self._left._get_unchecked(node)
+        inner = self._right._get_unchecked(c)
+        self._left._set_unchecked(node, inner)
+        if inner != _NIL:
+            self._parent._set_unchecked(inner, node)
+        self._replace_child(self._parent._get_unchecked(node), node, c)
+        self._right._set_unchecked(c, node)
+        self._parent._set_unchecked(node, c)
+        self._update_height(node)
+        self._update_height(c)
+        return c
+
+    def _rebalance(self, node: int) -> int:
+        """
+        rebalances the subtree at node, or just updates its height if balanced
+
+        returns:
+        the root of the subtree afterwards
+        """
+        balance = self._balance_factor(node)
+        if balance < -1:
+            #LR case rotates the left child first
+            if self._balance_factor(self._left._get_unchecked(node)) > 0:
+                self._rotate_left(self._left._get_unchecked(node))
+            return self._rotate_right(node)
+        if balance > 1:
+            #RL case rotates the right child first
+            if self._balance_factor(self._right._get_unchecked(node)) < 0:
+                self._rotate_right(self._right._get_unchecked(node))
+            return self._rotate_left(node)
+        self._update_height(node)
+        return node
+
+    def _rebalance_up(self, node: int) -> None:
+        """
+        rebalances node and each of its ancestors, stopping early once a
+        balanced subtree keeps its height since nothing above it changes
+        """
+        while node != _NIL:
+            height = self._height._get_unchecked(node)
+            top = self._rebalance(node)
+            if self._height._get_unchecked(top) == height:
+                return
+            node = self._parent._get_unchecked(top)
+
+    # ------------------------------------------------------------------ #
+
+    def add(self, value: object) -> None:
+        """
+        Adds an object to the tree and automatically balances it
+
+        parameters:
+        an object
+
+        returns:
+        nothing
+        """
+        if self._root == _NIL:
+            self._root = self._allocate(value, _NIL)
+            return
+
+        values, left, right = self._buffers()
+
+        #find the correct spot, ignoring duplicates
+        parent = _NIL
+        node = self._root
+        while node != _NIL:
+            parent = node
+            current = values[node]
+            if value < current:
+                node = left[node]
+            elif value > current:
+                node = right[node]
+            else:
+                return
+
+        goes_left = value < current
+        node = self._allocate(value, parent)
+        if goes_left:
+            self._left._set_unchecked(parent, node)
+        else:
+            self._right._set_unchecked(parent, node)
+
+        self._rebalance_up(parent)
+
+    def remove(self, value: object) -> bool:
+        """
+        Removes an object from the tree, frees its node and automatically balances the tree
+
+        parameters:
+        a value
+
+        returns:
+        a boolean whether it removed something or not
+        """
+        node = self._find(value)
+        if node == _NIL:
+            return False
+
+        changed = self._unlink(node)
+        self._release(node)
+        self._rebalance_up(changed)
+        return True
+
+    def is_valid(self) -> bool:
+        """
+        Return False if the tree breaks the ordering property, its links
+        are out of sync or any height is wrong.
+        """
+        if not super().is_valid():
+            return False
+
+        stack = Stack()
+        stack.push(self._root)
+        while not stack.is_empty():
+            node = stack.pop()
+            if node != _NIL:
+                left = self._left._get_unchecked(node)
+                right = self._right._get_unchecked(node)
+                if self._height._get_unchecked(node) != 1 + max(self._get_height(left), self._get_height(right)):
+                    return False
+                if abs(self._get_height(right) - self._get_height(left)) > 1:
+                    return False
+                stack.push(right)
+                stack.push(left)
+        return True
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == '__main__':
+
+    import random
+
+    print("\n# add / remove / contains - example 1")
+    for tree_type in (PooledBST, PooledAVL):
+        tree = tree_type((50, 40, 60, 30, 70, 20, 80, 45))
+        print(tree, tree.contains(45), tree.contains(46))
+        tree.remove(40)
+        tree.remove(50)
+        print(tree, tree.inorder_traversal(), tree.find_min(), tree.find_max())
+
+    print("\n# freelist reuses removed nodes - example 1")
+    tree = PooledAVL(range(10), typecode='q')
+    for value in range(0, 10, 2):
+        tree.remove(value)
+    print(tree.size(), tree.get_free_count(), tree)
+    tree.add(100)
+    tree.add(-1)
+    print(tree.size(), tree.get_free_count(), tree._values.length(), tree)
+
+    print("\n# stress test against BST / AVL - example 1")
+    from bst import BST
+    from avl import AVL
+    for tree_type, reference_type in ((PooledBST, BST), (PooledAVL, AVL)):
+        for _ in range(50):
+            case = [random.randrange(1, 500) for _ in range(200)]
+            tree, reference = tree_type(case), reference_type(case)
+            for value in case[:100]:
+                tree.remove(value)
+                reference.remove(value)
+            #AVL can diverge after its root is removed, so PooledAVL is checked against the values left
+            if tree_type is PooledBST:
+                same = str(tree)[3:] == str(reference)[3:]
+            else:
+                expected = sorted(set(case) - set(case[:100]))
+                same = str(tree.inorder_traversal()) == "QUEUE { " + ", ".join(map(str, expected)) + " }"
+            if not same or not tree.is_valid():
+                raise Exception("PROBLEM WITH POOLED TREE")
+    print('stress test finished')
@@ -0,0 +1,177 @@
+"""
+Compact node classes for the linked and tree structures.
+
+Each class mirrors the constructor, attributes and string form of the
+node it stands in for, but declares __slots__ instead of giving every
+instance its own __dict__. On 64-bit CPython a compact node takes 48-72
+bytes, about 40 bytes less than a plain node on 3.11+ and over 100
+less on older versions, which give each instance a dict. The original
+node classes are left as they are (SLNode.py must not change). The
+structures keep them as the default and accept one of these through
+their node_type (or entry_type) parameter:
+
+    LinkedList(node_type=CompactSLNode)             sll.py
+    Stack(node_type=CompactSLNode)                  stack_sll.py
+    Queue(node_type=CompactSLNode)                  queue_sll.py
+    HashMap(..., node_type=CompactChainNode)        hash_map_sc.py
+    HashMap(..., entry_type=CompactHashEntry)       hash_map_oa.py
+    BST(node_type=CompactBSTNode)                   bst.py
+    AVL(node_type=CompactAVLNode)                   avl.py
+
+Compact nodes cannot be given attributes other than their slots.
+"""
+
+
+class CompactSLNode:
+    """
+    Singly Linked List node with __slots__, for SLNode.SLNode
+    """
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value: object, next=None) -> None:
+        """
+        Initialize node given a value and the node after it
+
+        Parameters:
+        An object and an optional next node
+
+        Returns:
+        nothing
+        """
+        self.value = value
+        self.next = next
+
+
+class CompactChainNode:
+    """
+    Hash map chain node with __slots__, for include.SLNode
+    """
+    __slots__ = ('key', 'value', 'next')
+
+    def __init__(self, key: str, value: object, next: "CompactChainNode" = None) -> None:
+        """
+        Initialize node given a key, value and the node after it
+
+        Parameters:
+        A key, an object and an optional next node
+
+        Returns:
+        nothing
+        """
+        self.key = key
+        self.value = value
+        self.next = next
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return '(' + str(self.key) + ': ' + str(self.value) + ')'
+
+
+class CompactHashEntry:
+    """
+    Open addressing hash map entry with __slots__, for include.HashEntry
+    """
+    __slots__ = ('key', 'value', 'is_tombstone')
+
+    def __init__(self, key: str, value: object) -> None:
+        """
+        Initialize an entry for use in a hash map
+
+        Parameters:
+        A key and an object
+
+        Returns:
+        nothing
+        """
+        self.key = key
+        self.value = value
+        self.is_tombstone = False
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        return f"K: {self.key} V: {self.value} TS: {self.is_tombstone}"
+
+
+class CompactBSTNode:
+    """
+    Binary Search Tree node with __slots__, for bst.BSTNode
+    """
+    __slots__ = ('value', 'left', 'right')
+
+    def __init__(self, value: object) -> None:
+        """
+        Initialize a new BST node
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        self.value = value
+        self.left = None
+        self.right = None
+
+    def __str__(self) -> str:
+        """
+        Override string method
+        """
+        return 'BST Node: {}'.format(self.value)
+
+
+class CompactAVLNode(CompactBSTNode):
+    """
+    AVL Tree node with __slots__, for avl.AVLNode
+    """
+    __slots__ = ('parent', 'height')
+
+    def __init__(self, value: object) -> None:
+        """
+        Initialize a new AVL node
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        super().__init__(value)
+        self.parent = None
+        self.height = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method
+        """
+        return 'AVL Node: {}'.format(self.value)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import tracemalloc
+
+    from SLNode import SLNode
+    from avl import AVLNode
+
+    print("\n# bytes per node - example 1")
+    for plain, compact in ((SLNode, CompactSLNode), (AVLNode, CompactAVLNode)):
+        sizes = []
+        for node_type in (plain, compact):
+            tracemalloc.start()
+            nodes = [node_type(None) for _ in range(10_000)]
+            sizes.append(tracemalloc.get_traced_memory()[0] // 10_000)
+            tracemalloc.stop()
+        print(plain.__name__, sizes[0], compact.__name__, sizes[1])
+
+    print("\n# no extra attributes - example 1")
+    try:
+        CompactBSTNode(1).extra = True
+    except AttributeError as e:
+        print("Exception raised:", type(e))
@@ -1,4 +1,15 @@
+import array
+import os
+import pickle
+import struct
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy_backend
 from static_array import StaticArray
+from static_array_ops import copy_range, fill
+from typed_array import TypedStaticArray
 
 
 class DynamicArrayException(Exception):
@@ -8,20 +19,179 @@ class DynamicArrayException(Exception):
     pass
 
 
+# save() file layout: header, then raw elements for typed arrays or
+# length-prefixed pickled chunks of values for object arrays
+_SAVE_MAGIC = b'DARR'
+_SAVE_VERSION = 1
+_SAVE_HEADER = struct.Struct('<4sBcBcq')
+_SAVE_LENGTH = struct.Struct('<q')
+_SAVE_CHUNK = 1 << 16
+# numeric typecodes TypedStaticArray storage can hold (not the 'u'/'w' characters)
+_SAVE_TYPECODES = 'bBhHiIlLqQfd'
+
+
+def _remaining_bytes(file):
+    """
+    Return the number of bytes left to read in a seekable file, or None
+    """
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return end - position
+
+
+# snapshots copy the shared storage in blocks of 2 ** _SNAPSHOT_SHIFT elements
+_SNAPSHOT_SHIFT = 8
+
+
+class DynamicArrayIterator:
+    """
+    Separate iterator class for DynamicArray
+
+    Each loop gets its own iterator, so nested or concurrent loops over the
+    same array do not interfere. Values are read straight from the backing
+    buffer; the array's current size and storage are checked on every step,
+    so appends or resizes during the loop are handled like a Python list.
+    """
+
+    def __init__(self, array: "DynamicArray", reverse: bool = False) -> None:
+        """Initialize the iterator at the first (or last) element."""
+        self._array = array
+        self._step = -1 if reverse else 1
+        self._index = array._size - 1 if reverse else 0
+
+    def __iter__(self) -> "DynamicArrayIterator":
+        """Return the iterator."""
+        return self
+
+    def __next__(self) -> object:
+        """Obtain next value and advance iterator."""
+        index = self._index
+        array = self._array
+        if index < 0 or index >= array._size:
+            raise StopIteration
+
+        self._index = index + self._step
+        # index is within the size, so the storage's own bounds check is skipped
+        return array._data._data[index]
+
+
+class GrowthPolicy:
+    """
+    Capacity policy used by DynamicArray when it grows or shrinks
+
+    growth_factor: capacity multiplier used when a full array grows
+    shrink_threshold: shrink once size drops below this fraction of capacity (0 disables shrinking)
+    shrink_factor: capacity after shrinking, as a multiple of the size
+    min_capacity: arrays never shrink below this capacity
+
+    The gap between shrink_threshold and a full array is the hysteresis band:
+    right after a shrink the array is neither full nor below the threshold,
+    so alternating appends and removals cannot resize on every call.
+    """
+
+    def __init__(self, growth_factor=2, shrink_threshold=0.25, shrink_factor=2, min_capacity=10):
+        """
+        Initialize new growth policy
+        """
+        if growth_factor <= 1:
+            raise DynamicArrayException("growth_factor must be greater than 1")
+        if shrink_threshold < 0 or shrink_threshold >= 1:
+            raise DynamicArrayException("shrink_threshold must be in [0, 1)")
+        if shrink_threshold > 0 and (shrink_factor <= 1 or shrink_threshold * shrink_factor >= 1):
+            raise DynamicArrayException("shrink_factor must leave a shrunk array between the threshold and full")
+        if min_capacity < 1:
+            raise DynamicArrayException("min_capacity must be a positive integer")
+
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        self.shrink_factor = shrink_factor
+        self.min_capacity = min_capacity
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """
+        returns the capacity to grow to so that at least needed elements fit
+
+        Parameters:
+        current capacity and number of elements that must fit
+
+        Returns:
+        an int
+        """
+        new_capacity = max(capacity, 1)
+        while new_capacity < needed:
+            #always grows by at least one element, even for small factors
+            new_capacity = max(new_capacity + 1, int(new_capacity * self.growth_factor))
+
+        return new_capacity
+
+    def shrink(self, size: int, capacity: int):
+        """
+        returns the capacity to shrink to, or None if the array should keep its capacity
+
+        Parameters:
+        current size and capacity
+
+        Returns:
+        an int or None
+        """
+        if capacity <= self.min_capacity or size >= capacity * self.shrink_threshold:
+            return None
+
+        new_capacity = max(int(size * self.shrink_factor), self.min_capacity)
+        if new_capacity >= capacity:
+            return None
+
+        return new_capacity
+
+
+DEFAULT_POLICY = GrowthPolicy()
+
+
 class DynamicArray:
-    def __init__(self, start_array=None):
+    def __init__(self, start_array=None, typecode=None, policy=None, pool=None):
         """
         Initialize new dynamic array
+
+        If a typecode ('q', 'd', ... as accepted by the array module) is
+        given, elements are stored unboxed in a compact typed buffer
+        instead of a StaticArray of Python objects.
+        A GrowthPolicy may be passed to control how capacity changes.
+        A StaticArrayPool may be passed to recycle storage between resizes;
+        capacities are then rounded up to powers of two.
         """
         self._size = 0
         self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._typecode = typecode
+        self._policy = policy if policy is not None else DEFAULT_POLICY
+        self._pool = pool
+        self._resize_count = 0
+        self._copy_count = 0
+        self._views = None
+        self._indexes = None
+        # set once the storage is handed out by memoryview(), so it is never recycled
+        self._exported = False
+        self._data = self._new_storage(self._capacity)
 
         # populate dynamic array with initial values (if provided)
         # before using this feature, implement append() method
         if start_array is not None:
-            for value in start_array:
-                self.append(value)
+            self.extend(start_array)
+
+    def __getstate__(self) -> dict:
+        """
+        Return picklable state; views, attached indexes and the pool are tied to this process and are dropped
+        """
+        state = self.__dict__.copy()
+        state['_views'] = None
+        state['_indexes'] = None
+        state['_pool'] = None
+        return state
 
     def __str__(self) -> str:
         """
@@ -29,27 +199,20 @@ class DynamicArray:
         """
         out = "DYN_ARR Size/Cap: "
         out += str(self._size) + "/" + str(self._capacity) + ' ['
-        out += ', '.join([str(self._data[_]) for _ in range(self._size)])
+        out += ', '.join([str(self._get_unchecked(_)) for _ in range(self._size)])
         return out + ']'
 
-    def __iter__(self):
+    def __iter__(self) -> "DynamicArrayIterator":
         """
         Create iterator for loop
         """
-        self._index = 0
-        return self
+        return DynamicArrayIterator(self)
 
-    def __next__(self):
+    def __reversed__(self) -> "DynamicArrayIterator":
         """
-        Obtain next value and advance iterator
+        Create iterator going from the last element to the first
         """
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
-
-        self._index += 1
-        return value
+        return DynamicArrayIterator(self, reverse=True)
 
     def get_at_index(self, index: int) -> object:
         """
@@ -58,252 +221,1692 @@ class DynamicArray:
         """
         if index < 0 or index >= self._size:
             raise DynamicArrayException
-        return self._data[index]
+        #index is checked above, so the storage's own bounds check is skipped
+        return self._data._data[index]
 
     def set_at_index(self, index: int, value: object) -> None:
         """
-        Store value at given index in the array
-        Invalid index raises DynamicArrayException
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        if self._views:
+            self._notify_views(index, index + 1)
+        data = self._data._data
+        if self._indexes:
+            old = data[index]
+            data[index] = value
+            for listener in list(self._indexes):
+                listener._element_set(index, old, data[index])
+            return
+        data[index] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using array[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using array[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def _get_unchecked(self, index: int) -> object:
+        """
+        Return value at index, which the caller has proven is within the size
+        Used by the structures' own loops instead of the checked public indexing
+        """
+        return self._data._data[index]
+
+    def _set_unchecked(self, index: int, value: object) -> None:
+        """
+        Store value at index, which the caller has proven is within the size
+        Views and attached indexes are still told about the write
+        """
+        if self._views or self._indexes:
+            self.set_at_index(index, value)
+            return
+        self._data._data[index] = value
+
+    def is_empty(self) -> bool:
+        """
+        Return True is array is empty / False otherwise
+        """
+        return self._size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in array
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return the capacity of the array
+        """
+        return self._capacity
+
+    def get_typecode(self):
+        """
+        Return the typecode of a typed array, or None for object storage
+        """
+        return self._typecode
+
+    def get_policy(self) -> GrowthPolicy:
+        """
+        Return the growth policy used by the array
+        """
+        return self._policy
+
+    def get_pool(self):
+        """
+        Return the StaticArrayPool the array recycles storage with, or None
+        """
+        return self._pool
+
+    def get_resize_count(self) -> int:
+        """
+        Return the number of times the storage was reallocated
+        """
+        return self._resize_count
+
+    def get_copy_count(self) -> int:
+        """
+        Return the number of elements copied by reallocations
+        """
+        return self._copy_count
+
+    def _new_storage(self, capacity: int):
+        """
+        Allocate backing storage of the given capacity for this array
+        """
+        if self._pool is not None:
+            return self._pool.acquire(capacity, self._typecode)
+        if self._typecode is None:
+            return StaticArray(capacity)
+        return TypedStaticArray(self._typecode, capacity)
+
+    def print_da_variables(self) -> None:
+        """
+        Print information contained in the dynamic array.
+        Used for testing purposes.
+        """
+        print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
+
+    # -----------------------------------------------------------------------
+    
+    def resize(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the dynamic array to the number passed in
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        #checks eligibility
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        if self._pool is not None:
+            #pooled storage comes in power-of-two sizes
+            new_capacity = self._pool.size_class(new_capacity)
+            if new_capacity == self._capacity:
+                return
+        
+        self._capacity = new_capacity
+
+        new_arr = self._new_storage(self._capacity)
+
+        #copies data
+        copy_range(self._data, 0, new_arr, 0, self._size)
+
+        #storage still read by views or an exported memoryview must not be reused
+        if self._pool is not None and not self._views and not self._exported:
+            self._pool.release(self._data)
+        self._exported = False
+
+        self._data = new_arr
+
+        self._resize_count += 1
+        self._copy_count += self._size
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the array can hold the given number of elements without resizing
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Reduces the capacity to the number of elements stored (at least 1)
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        if self._capacity > max(self._size, 1):
+            self.resize(max(self._size, 1))
+
+    def append(self, value: object) -> None:
+        """
+        Adds an object to the end of the array, increasing capacity as necessary
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        if self._capacity == self._size:
+            #resize if necessary
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+
+        #stores before growing the size so a value rejected by typed storage leaves the array unchanged
+        data = self._data._data
+        data[self._size] = value
+
+        self._size += 1
+
+        if self._indexes:
+            for listener in list(self._indexes):
+                listener._element_appended(data[self._size - 1])
+
+    @classmethod
+    def from_iterable(cls, values, typecode=None, policy=None, size_hint=None) -> "DynamicArray":
+        """
+        Builds a new array from any iterable, reserving capacity up front
+
+        Parameters:
+        An iterable, optional typecode, growth policy and expected number of values
+
+        Returns:
+        new dynamic array
+        """
+        new_arr = cls(typecode=typecode, policy=policy)
+        new_arr.extend(values, size_hint)
+        return new_arr
+
+    def extend(self, values, size_hint=None) -> None:
+        """
+        Adds every value of an iterable to the end of the array
+
+        Capacity is reserved once from len(values) (or size_hint for iterables
+        without a length) and values are then written straight into storage.
+        Typed arrays with the same typecode are block-copied.
+
+        Parameters:
+        An iterable and optional expected number of values
+
+        Returns:
+        nothing
+        """
+        if isinstance(values, DynamicArray):
+            self._extend_from_array(values)
+            return
+
+        try:
+            count = len(values)
+        except TypeError:
+            count = size_hint
+
+        if count:
+            self.reserve(self._policy.grow(self._capacity, self._size + count))
+
+        #every position written is below the capacity, so the raw buffer is used
+        store = self._data._data.__setitem__
+        end = self._capacity
+        i = self._size
+        try:
+            for value in values:
+                if i == end:
+                    #the length or hint was too small, so fall back to policy growth
+                    self._size = i
+                    self.resize(self._policy.grow(self._capacity, i + 1))
+                    store = self._data._data.__setitem__
+                    end = self._capacity
+                store(i, value)
+                i += 1
+        finally:
+            #keeps everything stored so far if a value is rejected part way through
+            self._size = i
+            if self._indexes:
+                self._invalidate_indexes()
+
+    def _extend_from_array(self, other: "DynamicArray") -> None:
+        """
+        Appends the contents of another DynamicArray using a single reservation
+
+        Parameters:
+        A dynamic array
+
+        Returns:
+        nothing
+        """
+        count = other._size
+        start = self._size
+        if count == 0:
+            return
+
+        self.reserve(self._policy.grow(self._capacity, start + count))
+
+        #read the source storage after reserving, in case other is self
+        copy_range(other._data, 0, self._data, start, count)
+
+        self._size = start + count
+        if self._indexes:
+            self._invalidate_indexes()
+
+    def save(self, path_or_file) -> None:
+        """
+        Writes the array to a file path or binary file object in a compact format
+
+        Typed arrays are written as one block of raw element bytes. Object
+        arrays are written as pickled chunks, each prefixed with its length.
+
+        Parameters:
+        A path or a file opened for binary writing
+
+        Returns:
+        nothing
+        """
+        if isinstance(path_or_file, (str, bytes, os.PathLike)):
+            with open(path_or_file, 'wb') as file:
+                self.save(file)
+            return
+
+        file = path_or_file
+        typecode = self._typecode or 'O'
+        itemsize = 0 if self._typecode is None else self._data.itemsize()
+        byteorder = b'<' if sys.byteorder == 'little' else b'>'
+        file.write(_SAVE_HEADER.pack(_SAVE_MAGIC, _SAVE_VERSION, typecode.encode(), itemsize, byteorder, self._size))
+
+        if self._typecode is not None:
+            #only the used part of the buffer is written, straight from storage
+            file.write(memoryview(self._data._data)[0:self._size])
+            return
+
+        values = self._data._data
+        for start in range(0, self._size, _SAVE_CHUNK):
+            chunk = pickle.dumps(values[start:min(start + _SAVE_CHUNK, self._size)], pickle.HIGHEST_PROTOCOL)
+            file.write(_SAVE_LENGTH.pack(len(chunk)))
+            file.write(chunk)
+
+    @classmethod
+    def load(cls, path_or_file, policy=None) -> "DynamicArray":
+        """
+        Reads an array written by save() from a file path or binary file object
+
+        Capacity is reserved from the stored count and the file is read in
+        chunks straight into the new storage, so loading never holds a
+        second copy of the data. Invalid, corrupt or truncated files raise
+        DynamicArrayException, including headers with an unknown typecode,
+        a count larger than the rest of a seekable file and chunks holding
+        more values than the count.
+
+        Parameters:
+        A path or a file opened for binary reading, optional growth policy
+
+        Returns:
+        new dynamic array
+        """
+        if isinstance(path_or_file, (str, bytes, os.PathLike)):
+            with open(path_or_file, 'rb') as file:
+                return cls.load(file, policy)
+
+        return cls._load_from(path_or_file, lambda typecode: cls(typecode=typecode, policy=policy))
+
+    @staticmethod
+    def _load_from(file, new_array) -> "DynamicArray":
+        """
+        Reads a file written by save() into the empty array new_array(typecode) returns
+        (typecode is None for object arrays)
+        """
+        header = file.read(_SAVE_HEADER.size)
+        if len(header) != _SAVE_HEADER.size:
+            raise DynamicArrayException
+        magic, version, typecode, itemsize, byteorder, count = _SAVE_HEADER.unpack(header)
+        if magic != _SAVE_MAGIC or version != _SAVE_VERSION or count < 0:
+            raise DynamicArrayException
+
+        typecode = typecode.decode('latin-1')
+        if typecode != 'O' and (typecode not in _SAVE_TYPECODES or array.array(typecode).itemsize != itemsize):
+            raise DynamicArrayException
+
+        #every element takes at least one byte of the file, so a count beyond
+        #what is left is corrupt; unseekable streams are read without trusting it
+        remaining = _remaining_bytes(file)
+        if remaining is not None and count * (1 if typecode == 'O' else itemsize) > remaining:
+            raise DynamicArrayException
+
+        new_arr = new_array(None if typecode == 'O' else typecode)
+        new_arr.reserve(count if remaining is not None else min(count, _SAVE_CHUNK))
+
+        if typecode != 'O':
+            done = 0
+            while done < count:
+                step = min(_SAVE_CHUNK, count - done)
+                if new_arr._capacity < done + step:
+                    new_arr.reserve(min(count, max(done + step, 2 * new_arr._capacity)))
+                with memoryview(new_arr._data._data).cast('B') as target:
+                    position = done * itemsize
+                    end = position + step * itemsize
+                    while position < end:
+                        read = file.readinto(target[position:end])
+                        if not read:
+                            raise DynamicArrayException
+                        position += read
+                done += step
+            if byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+                data = new_arr._data._data
+                if isinstance(data, array.array):
+                    data.byteswap()
+                else:
+                    #buffers such as a mapped file's memoryview are swapped through a copy
+                    swapped = array.array(typecode, data[:count])
+                    swapped.byteswap()
+                    data[:count] = swapped
+            new_arr._size = count
+            return new_arr
+
+        while new_arr._size < count:
+            length = file.read(_SAVE_LENGTH.size)
+            if len(length) != _SAVE_LENGTH.size:
+                raise DynamicArrayException
+            size = _SAVE_LENGTH.unpack(length)[0]
+            remaining = _remaining_bytes(file)
+            if size < 0 or (remaining is not None and size > remaining):
+                raise DynamicArrayException
+            chunk = file.read(size)
+            if len(chunk) != size:
+                raise DynamicArrayException
+            try:
+                values = pickle.loads(chunk)
+            except Exception:
+                #a damaged chunk can fail to unpickle in many ways
+                raise DynamicArrayException
+            #chunks holding more values than the header counted are corrupt
+            if not isinstance(values, list) or len(values) > count - new_arr._size:
+                raise DynamicArrayException
+            new_arr.extend(values)
+
+        return new_arr
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Inserts new object at specified index. shifting other elements right
+
+        Parameters:
+        An int and object
+
+        Returns:
+        nothing
+        """    
+
+        if self._capacity == self._size:
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+
+        if index < 0 or index >= self._size + 1:
+            raise DynamicArrayException
+
+        if self._views:
+            self._notify_views(index, self._size)
+        if self._indexes:
+            self._invalidate_indexes()
+
+        #stores value in the spare slot first so a value rejected by typed storage leaves the array unchanged
+        data = self._data._data
+        data[self._size] = value
+
+        #shifts the tail right by one
+        copy_range(self._data, index, self._data, index + 1, self._size - index)
+
+        data[index] = value
+
+        self._size += 1
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes object at specified index, moving other elements left
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+
+        if self._views:
+            self._notify_views(index, self._size)
+        if self._indexes:
+            self._invalidate_indexes()
+
+        copy_range(self._data, index + 1, self._data, index, self._size - index - 1)
+
+        #clears the vacated slot so object storage drops its reference
+        self._data._data[self._size - 1] = None if self._typecode is None else 0
+
+        self._size -= 1
+
+        #asks the policy after the removal, so the decision uses the new size
+        new_capacity = self._policy.shrink(self._size, self._capacity)
+        if new_capacity is not None:
+            self.resize(new_capacity)
+
+    def remove_many(self, indices) -> int:
+        """
+        Removes the elements at all given indices in a single compaction pass
+
+        Parameters:
+        An iterable of ints (duplicates are removed once)
+
+        Returns:
+        the number of elements removed
+        """
+        removed = set()
+        for index in indices:
+            if index < 0 or index >= self._size:
+                raise DynamicArrayException
+            removed.add(index)
+
+        if not removed:
+            return 0
+
+        first = min(removed)
+        if self._views:
+            self._notify_views(first, self._size)
+
+        data = self._data._data
+        write = first
+        for read in range(first, self._size):
+            if read not in removed:
+                data[write] = data[read]
+                write += 1
+
+        self._finish_compaction(write, self._size)
+        return len(removed)
+
+    def remove_if(self, predicate) -> int:
+        """
+        Removes every element for which predicate returns True, in a single pass
+
+        Parameters:
+        A function
+
+        Returns:
+        the number of elements removed
+        """
+        size = self._size
+        data = self._data._data
+
+        #finds the first element to remove before touching anything
+        write = 0
+        while write < size and not predicate(data[write]):
+            write += 1
+        if write == size:
+            return 0
+
+        if self._views:
+            self._notify_views(write, size)
+
+        read = write + 1
+        try:
+            while read < size:
+                value = data[read]
+                if not predicate(value):
+                    data[write] = value
+                    write += 1
+                read += 1
+        finally:
+            #if predicate raised, the elements not yet checked are kept
+            self._finish_compaction(write, read)
+
+        return size - self._size
+
+    def _finish_compaction(self, write: int, read: int) -> None:
+        """
+        Moves elements read..size-1 down to write, clears the freed slots and
+        applies the shrink policy once
+        """
+        size = self._size
+        copy_range(self._data, read, self._data, write, size - read)
+
+        new_size = write + size - read
+        fill(self._data, new_size, size - new_size, None if self._typecode is None else 0)
+
+        self._size = new_size
+        if self._indexes:
+            self._invalidate_indexes()
+
+        new_capacity = self._policy.shrink(self._size, self._capacity)
+        if new_capacity is not None:
+            self.resize(new_capacity)
+
+    def slice(self, start_index: int, size: int) -> "DynamicArray":
+        """
+        Returns a new array with specified starting index of old array and size
+
+        Parameters:
+        Two ints
+
+        Returns:
+        new dynamic array
+        """
+
+        #checks conditions to throw exception
+        if size < 0 or start_index < 0 or start_index > self._size - 1 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        new_arr = DynamicArray(typecode=self._typecode, policy=self._policy)
+
+        #reserves the capacity appending one by one would have reached, then copies in one block
+        new_arr.reserve(self._policy.grow(new_arr._capacity, size))
+        copy_range(self._data, start_index, new_arr._data, 0, size)
+        new_arr._size = size
+
+        return new_arr
+
+    def sort(self, key=None, reverse=False) -> None:
+        """
+        Sorts the array in place, keeping equal elements in their original order
+
+        Uses an adaptive natural merge sort: existing ascending and strictly
+        descending runs are found first and merged, so sorted or nearly
+        sorted input takes close to linear time. Typed integer arrays without
+        a key use an LSD radix sort when the input is not mostly sorted.
+
+        Parameters:
+        optional key function and reverse flag
+
+        Returns:
+        nothing
+        """
+        n = self._size
+        if n < 2:
+            return
+
+        if self._views:
+            self._notify_views(0, n)
+        if self._indexes:
+            self._invalidate_indexes()
+
+        values = self._data._data
+
+        #sorting the reversed array stably and reversing back keeps equal elements in order
+        if reverse:
+            values[0:n] = values[n - 1::-1]
+
+        if key is None and self._typecode in _RADIX_TYPECODES and _count_descents(values, n) > n // 16:
+            _radix_sort(values, n)
+        elif key is None:
+            _merge_sort(values, None, n)
+        else:
+            keys = StaticArray(n)._data
+            for i in range(n):
+                keys[i] = key(values[i])
+            _merge_sort(keys, values, n)
+
+        if reverse:
+            values[0:n] = values[n - 1::-1]
+
+    def memoryview(self) -> memoryview:
+        """
+        Returns a writable memoryview over the elements of a typed array, without copying
+
+        The memoryview can be passed to NumPy, struct, socket.sendall() or
+        readinto(). Writes through it bypass the array, so while the storage
+        is exported: existing views and snapshots copy their windows now,
+        new views and snapshots copy eagerly instead of sharing the storage,
+        and attached indexes rebuild on every query (O(n) each). This lasts
+        until the array is reallocated (resize, growth or shrinking); the
+        memoryview then keeps referring to the old storage, so take a new
+        one. Object arrays raise DynamicArrayException.
+
+        Parameters:
+        nothing
+
+        Returns:
+        a memoryview of length() elements
+        """
+        if self._typecode is None:
+            raise DynamicArrayException
+
+        if self._views:
+            self._notify_views(0, self._size)
+        if self._indexes:
+            self._invalidate_indexes()
+
+        self._exported = True
+        return memoryview(self._data._data)[0:self._size]
+
+    def __buffer__(self, flags: int) -> "memoryview":
+        """
+        Buffer protocol support (Python 3.12+), so memoryview(array) works like array.memoryview()
+        """
+        return self.memoryview()
+
+    def lazy(self) -> "LazyPipeline":
+        """
+        Returns a lazy pipeline reading this array, for fused map/filter/reduce chains
+
+        Parameters:
+        nothing
+
+        Returns:
+        a LazyPipeline
+        """
+        return LazyPipeline(self)
+
+    def view(self, start_index: int, size: int) -> "DynamicArrayView":
+        """
+        Returns a read-mostly view of part of the array without copying it
+
+        The view shares this array's storage. It copies its window only when
+        it is written to, or right before this array overwrites or shifts
+        elements inside the window.
+
+        Parameters:
+        Two ints
+
+        Returns:
+        a DynamicArrayView
+        """
+        #unlike slice(), an empty window at the end of the array is allowed
+        if size < 0 or start_index < 0 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        view = DynamicArrayView(self, self._data, start_index, size)
+        if self._exported:
+            #an exported memoryview can write the storage without notice
+            view._materialize()
+        return view
+
+    def snapshot(self) -> "DynamicArraySnapshot":
+        """
+        Returns an immutable, consistent copy of the array in O(1)
+
+        The snapshot shares this array's storage. Before the array changes
+        an element the snapshot can see, the snapshot copies just the block
+        holding it, so appends cost nothing and other writes copy one block.
+        While a memoryview() of the storage is exported the snapshot copies
+        every block right away, which is O(n).
+
+        Parameters:
+        nothing
+
+        Returns:
+        a DynamicArraySnapshot
+        """
+        snapshot = DynamicArraySnapshot(self, self._data, 0, self._size)
+        if self._exported:
+            #an exported memoryview can write the storage without notice
+            snapshot._before_source_write(self._data, 0, self._size)
+        return snapshot
+
+    def _register_view(self, view: "DynamicArrayView") -> None:
+        """
+        Remembers a view sharing this array's storage
+        """
+        if self._views is None:
+            self._views = weakref.WeakSet()
+        self._views.add(view)
+
+    def _notify_views(self, start: int, end: int) -> None:
+        """
+        Lets views sharing the storage copy their window before positions
+        start..end-1 are overwritten
+        """
+        for view in list(self._views):
+            view._before_source_write(self._data, start, end)
+
+    def attach_index(self, index) -> None:
+        """
+        Keeps an index over the array's values up to date, such as a FenwickIndex
+
+        The index is told about every change: index._element_set(position,
+        old, new) after a value is replaced, index._element_appended(value)
+        after an append, and index._invalidate() after any other change
+        (insert, remove, extend, sort, ...), after which it rebuilds itself
+        when next queried. Writes through an exported memoryview() are not
+        reported, so while the array's _exported flag is set an index must
+        rebuild on every query. The array only holds a weak reference, so an
+        index stops costing anything once it is no longer used.
+
+        Parameters:
+        An index object
+
+        Returns:
+        nothing
+        """
+        if self._indexes is None:
+            self._indexes = weakref.WeakSet()
+        self._indexes.add(index)
+
+    def detach_index(self, index) -> None:
+        """
+        Stops keeping the given index up to date
+
+        Parameters:
+        An index object
+
+        Returns:
+        nothing
+        """
+        if self._indexes is not None:
+            self._indexes.discard(index)
+
+    def _invalidate_indexes(self) -> None:
+        """
+        Tells attached indexes that values changed in a way they do not track
+        """
+        for index in list(self._indexes):
+            index._invalidate()
+
+    def merge(self, second_da: "DynamicArray") -> None:
+        """
+        Adds a new array to the existing one
+
+        Parameters:
+        A second array
+
+        Returns:
+        nothing
+        """
+        #bulk copy instead of appending one value at a time
+        self.extend(second_da)
+
+    def _from_ndarray(self, values) -> "DynamicArray":
+        """
+        Builds a new array holding the values of a 1-D ndarray, typed when possible
+        """
+        typecode = numpy_backend.typecode_for(values)
+        if typecode is None:
+            return DynamicArray(values.tolist(), policy=self._policy)
+
+        new_arr = DynamicArray(typecode=typecode, policy=self._policy)
+        new_arr.reserve(new_arr._policy.grow(new_arr._capacity, len(values)))
+        numpy_backend.as_ndarray(new_arr._data, 0, len(values))[:] = values
+        new_arr._size = len(values)
+        return new_arr
+
+    def _chunks(self, workers: int):
+        """
+        Splits the array into copies of consecutive chunks, a few per worker
+        """
+        count = min(self._size, workers * 4)
+        step = -(-self._size // count)
+        for start in range(0, self._size, step):
+            yield self.slice(start, min(step, self._size - start))
+
+    def _run_parallel(self, task, func, workers):
+        """
+        Runs task(func, chunk) for every chunk in a process pool, returning results in order
+        """
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(task, func, chunk) for chunk in self._chunks(workers)]
+            for future in futures:
+                yield future.result()
+
+    def map(self, map_func, vectorized=False, parallel=False, workers=None) -> "DynamicArray":
+        """
+        returns a new array with each value being put into the passed in function
+        (the result uses object storage, since map_func may change types)
+
+        Typed arrays apply NumPy ufuncs, or any callable flagged with
+        vectorized=True, to the whole array at once when NumPy is installed;
+        the results are converted back to Python objects, so the new array
+        is the same with or without NumPy. Integers narrower than 64 bits
+        are widened to 'q' first so results do not wrap around in the
+        storage type.
+
+        With parallel=True (or workers=N) the array is split into chunks that
+        are mapped in a process pool; map_func must then be picklable, e.g. a
+        module-level function. Results keep their original order.
+
+        Parameters:
+        A function, optional flag that it accepts whole ndarrays, and parallel options
+
+        Returns:
+        new dynamic array
+        """
+        workers = _worker_count(parallel, workers)
+        if workers > 1 and self._size > 1:
+            new_arr = DynamicArray(policy=self._policy)
+            for part in self._run_parallel(_map_chunk, map_func, workers):
+                new_arr.extend(part)
+            return new_arr
+
+        if self._typecode is not None and self._size > 0 and numpy_backend.can_vectorize(map_func, vectorized):
+            values = numpy_backend.as_ndarray(self._data, 0, self._size)
+            mapped = numpy_backend.apply(map_func, numpy_backend.widened(values))
+            return DynamicArray(mapped.tolist(), policy=self._policy)
+
+        new_arr = DynamicArray(policy=self._policy)
+        get = self._get_unchecked
+
+        for i in range(self._size):
+            #adds new values after pass through function
+            new_arr.append(map_func(get(i)))
+
+        return new_arr
+
+    def filter(self, filter_func, vectorized=False, parallel=False, workers=None) -> "DynamicArray":
+        """
+        returns a new array with each value that satisfies the function staying in
+
+        Typed arrays evaluate NumPy ufuncs, or any predicate flagged with
+        vectorized=True, as one boolean mask when NumPy is installed.
+
+        parallel=True (or workers=N) evaluates chunks in a process pool,
+        as in map(); filter_func must then be picklable.
+
+        Parameters:
+        A function, optional flag that it accepts whole ndarrays, and parallel options
+
+        Returns:
+        new dynamic array
+        """
+        workers = _worker_count(parallel, workers)
+        if workers > 1 and self._size > 1:
+            new_arr = DynamicArray(typecode=self._typecode, policy=self._policy)
+            for part in self._run_parallel(_filter_chunk, filter_func, workers):
+                new_arr.extend(part)
+            return new_arr
+
+        if self._typecode is not None and self._size > 0 and numpy_backend.can_vectorize(filter_func, vectorized):
+            values = numpy_backend.as_ndarray(self._data, 0, self._size)
+            return self._from_ndarray(values[numpy_backend.mask(filter_func, values)])
+
+        new_arr = DynamicArray(typecode=self._typecode, policy=self._policy)
+        get = self._get_unchecked
+
+        for i in range(self._size):
+            value = get(i)
+            if filter_func(value):
+                #appends values that pass test
+                new_arr.append(value)
+
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None, parallel=False, workers=None) -> object:
+        """
+        returns an object with the passed in function being applied sequentially
+
+        Typed arrays reduce in bulk with NumPy when reduce_func is add,
+        multiply, minimum or maximum (as a ufunc or as operator.add,
+        operator.mul, min and max) and the result is certain to match the
+        per-element loop: float sums and products, floats holding NaN, integer
+        products and integer sums that could leave 64 bits use the loop.
+
+        parallel=True (or workers=N) reduces chunks in a process pool and then
+        combines the partial results in order, which is only correct when
+        reduce_func is associative. reduce_func must then be picklable.
+
+        Parameters:
+        A function, optional initializer and parallel options
+
+        Returns:
+        an object
+        """
+        #edge case
+        if self._size == 0:
+            return initializer
+
+        workers = _worker_count(parallel, workers)
+        if workers > 1 and self._size > 1:
+            partials = DynamicArray(self._run_parallel(_reduce_chunk, reduce_func, workers))
+            return partials.reduce(reduce_func, initializer)
+
+        if self._typecode is not None and numpy_backend.available():
+            values = numpy_backend.as_ndarray(self._data, 0, self._size)
+            ufunc = numpy_backend.reducer_for(reduce_func, values, initializer)
+            if ufunc is not None:
+                return numpy_backend.reduce(ufunc, values, initializer)
+
+        get = self._get_unchecked
+        if initializer == None:
+            initializer = get(0)
+            start = 1
+        else:
+            start = 0
+
+        accumulator = initializer
+        for i in range(start, self._size):
+            #repeats process with itself
+            accumulator = reduce_func(accumulator, get(i))
+
+        return accumulator
+
+# typecodes of integer storage that sort() can radix sort
+_RADIX_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q')
+
+
+def _count_descents(values, n: int) -> int:
+    """
+    Counts positions where the next value is smaller, a cheap measure of disorder
+    """
+    descents = 0
+    previous = values[0]
+    for i in range(1, n):
+        current = values[i]
+        if current < previous:
+            descents += 1
+        previous = current
+    return descents
+
+
+def _radix_sort(values, n: int) -> None:
+    """
+    Sorts the first n integers of a typed buffer with an LSD radix sort
+    """
+    low = min(values[0:n])
+    span = max(values[0:n]) - low
+
+    #wider digits mean fewer passes, but the bucket table must stay small next to n
+    bits = 16 if n > 1 << 16 else 8
+    mask = (1 << bits) - 1
+
+    src = values
+    dst = TypedStaticArray(_buffer_typecode(values), n)._data
+    shift = 0
+    while span >> shift:
+        counts = TypedStaticArray('q', mask + 2)._data
+        for i in range(n):
+            counts[((src[i] - low) >> shift & mask) + 1] += 1
+        for digit in range(mask + 1):
+            counts[digit + 1] += counts[digit]
+        for i in range(n):
+            value = src[i]
+            digit = (value - low) >> shift & mask
+            dst[counts[digit]] = value
+            counts[digit] += 1
+        src, dst = dst, src
+        shift += bits
+
+    if src is not values:
+        values[0:n] = src[0:n]
+
+
+def _buffer_typecode(buffer):
+    """
+    Returns the typecode of a typed buffer (array or memoryview), or None for a list
+    """
+    if isinstance(buffer, memoryview):
+        return buffer.format
+    return getattr(buffer, 'typecode', None)
+
+
+def _scratch(buffer, size: int):
+    """
+    Returns an empty buffer of the same kind as buffer (list, typed array or memoryview)
+    """
+    typecode = _buffer_typecode(buffer)
+    if isinstance(buffer, memoryview):
+        #arrays only accept slices of other arrays, so mapped storage gets a memoryview too
+        return memoryview(TypedStaticArray(typecode, max(size, 1))._data)
+    if typecode is not None:
+        return TypedStaticArray(typecode, max(size, 1))._data
+    return StaticArray(max(size, 1))._data
+
+
+def _min_run(n: int) -> int:
+    """
+    Returns the minimum run length for the merge sort, between 32 and 64
+    """
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def _insertion_sort(keys, values, lo: int, start: int, hi: int) -> None:
+    """
+    Extends the sorted range keys[lo:start] to keys[lo:hi] with binary insertion
+    """
+    for i in range(start, hi):
+        pivot = keys[i]
+        left, right = lo, i
+        #finds the position after any equal keys, so the sort stays stable
+        while left < right:
+            middle = (left + right) // 2
+            if pivot < keys[middle]:
+                right = middle
+            else:
+                left = middle + 1
+        if left == i:
+            continue
+        keys[left + 1:i + 1] = keys[left:i]
+        keys[left] = pivot
+        if values is not None:
+            value = values[i]
+            values[left + 1:i + 1] = values[left:i]
+            values[left] = value
+
+
+def _merge(keys, values, key_tmp, value_tmp, lo: int, mid: int, hi: int) -> None:
+    """
+    Merges the sorted ranges keys[lo:mid] and keys[mid:hi], moving values along
+    """
+    if not keys[mid] < keys[mid - 1]:
+        #already in order
+        return
+
+    count = mid - lo
+    key_tmp[0:count] = keys[lo:mid]
+    if values is not None:
+        value_tmp[0:count] = values[lo:mid]
+
+    i, j, k = 0, mid, lo
+    while i < count and j < hi:
+        #takes from the right only when strictly smaller, which keeps the merge stable
+        if keys[j] < key_tmp[i]:
+            keys[k] = keys[j]
+            if values is not None:
+                values[k] = values[j]
+            j += 1
+        else:
+            keys[k] = key_tmp[i]
+            if values is not None:
+                values[k] = value_tmp[i]
+            i += 1
+        k += 1
+
+    if i < count:
+        keys[k:k + count - i] = key_tmp[i:count]
+        if values is not None:
+            values[k:k + count - i] = value_tmp[i:count]
+
+
+def _merge_sort(keys, values, n: int) -> None:
+    """
+    Stable natural merge sort of keys[0:n]; values (if given) are permuted the same way
+    """
+    min_run = _min_run(n)
+    runs = DynamicArray(typecode='q')
+
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n and keys[end] < keys[start]:
+            #strictly descending run, reversed in place (strictness keeps it stable)
+            while end + 1 < n and keys[end + 1] < keys[end]:
+                end += 1
+            end += 1
+            keys[start:end] = keys[end - 1:start - 1 if start else None:-1]
+            if values is not None:
+                values[start:end] = values[end - 1:start - 1 if start else None:-1]
+        else:
+            while end < n and not keys[end] < keys[end - 1]:
+                end += 1
+
+        if end - start < min_run:
+            forced = min(start + min_run, n)
+            _insertion_sort(keys, values, start, end, forced)
+            end = forced
+
+        runs.append(start)
+        start = end
+    runs.append(n)
+
+    #left runs can outgrow half of n; lists and arrays grow on slice assignment, memoryviews cannot
+    size = n if isinstance(keys, memoryview) or isinstance(values, memoryview) else n // 2 + 1
+    key_tmp = _scratch(keys, size)
+    value_tmp = _scratch(values, size) if values is not None else None
+
+    #merges neighbouring runs pairwise until one run is left
+    while runs.length() > 2:
+        merged = DynamicArray(typecode='q')
+        i = 0
+        while i + 2 < runs.length():
+            _merge(keys, values, key_tmp, value_tmp, runs[i], runs[i + 1], runs[i + 2])
+            merged.append(runs[i])
+            i += 2
+        if i + 1 < runs.length():
+            merged.append(runs[i])
+        merged.append(n)
+        runs = merged
+
+
+def _worker_count(parallel: bool, workers) -> int:
+    """
+    Returns how many worker processes map/filter/reduce should use
+    """
+    if workers is not None:
+        return workers
+    if parallel:
+        return os.cpu_count() or 1
+    return 1
+
+
+def _map_chunk(map_func, chunk: DynamicArray) -> DynamicArray:
+    """
+    Process pool task for DynamicArray.map
+    """
+    return chunk.map(map_func)
+
+
+def _filter_chunk(filter_func, chunk: DynamicArray) -> DynamicArray:
+    """
+    Process pool task for DynamicArray.filter
+    """
+    return chunk.filter(filter_func)
+
+
+def _reduce_chunk(reduce_func, chunk: DynamicArray) -> object:
+    """
+    Process pool task for DynamicArray.reduce
+    """
+    return chunk.reduce(reduce_func)
+
+
+class DynamicArrayView:
+    """
+    Window over the storage of a DynamicArray, created by DynamicArray.view()
+
+    Reads go straight to the shared storage. The window is copied into
+    private storage (copy-on-write) when the view is written to, or when the
+    source array is about to change an element inside the window.
+    """
+
+    def __init__(self, source, storage, start: int, size: int) -> None:
+        """
+        Initialize new view of size elements of storage, starting at start
+        """
+        self._source = source
+        self._data = storage
+        self._start = start
+        self._size = size
+        self._typecode = source._typecode
+        self._policy = source._policy
+        self._views = None
+        source._register_view(self)
+
+    def __str__(self) -> str:
+        """
+        Return content of view in human-readable form
+        """
+        out = "DYN_ARR_VIEW Size: " + str(self._size) + ' ['
+        out += ', '.join([str(self._data._data[self._start + _]) for _ in range(self._size)])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the values in the view
+        """
+        for i in range(self._size):
+            #re-reads the storage each step, since the view may copy its window mid-loop
+            yield self._data._data[self._start + i]
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position of the view
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._data._data[self._start + index]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index, copying the window first if it is still shared
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        if self._source is not None:
+            self._materialize()
+        if self._views:
+            self._notify_views(index, index + 1)
+        self._data._data[index] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index(), using view[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index(), using view[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True if the view is empty / False otherwise
+        """
+        return self._size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements in the view
+        """
+        return self._size
+
+    def get_typecode(self):
+        """
+        Return the typecode of the source array, or None for object storage
+        """
+        return self._typecode
+
+    def is_shared(self) -> bool:
+        """
+        Return True while the view still shares storage with its source
+        """
+        return self._source is not None
+
+    def _materialize(self) -> None:
+        """
+        Copies the window into private storage and detaches from the source
+        """
+        if self._typecode is None:
+            storage = StaticArray(max(self._size, 1))
+        else:
+            storage = TypedStaticArray(self._typecode, max(self._size, 1))
+
+        copy_range(self._data, self._start, storage, 0, self._size)
+
+        self._source._views.discard(self)
+        self._source = None
+        self._data = storage
+        self._start = 0
+
+    def _before_source_write(self, storage, start: int, end: int) -> None:
+        """
+        Called by the source before it writes positions start..end-1 of storage
+        """
+        if self._source is None or storage is not self._data:
+            return
+        if start < self._start + self._size and end > self._start:
+            self._materialize()
+
+    def _register_view(self, view: "DynamicArrayView") -> None:
+        """
+        Remembers a view sharing this view's private storage
+        """
+        if self._views is None:
+            self._views = weakref.WeakSet()
+        self._views.add(view)
+
+    def _notify_views(self, start: int, end: int) -> None:
+        """
+        Lets views sharing the private storage copy their window before
+        positions start..end-1 are overwritten
+        """
+        for view in list(self._views):
+            view._before_source_write(self._data, start, end)
+
+    def lazy(self) -> "LazyPipeline":
+        """
+        Returns a lazy pipeline reading this view, for fused map/filter/reduce chains
+
+        Parameters:
+        nothing
+
+        Returns:
+        a LazyPipeline
+        """
+        return LazyPipeline(self)
+
+    def view(self, start_index: int, size: int) -> "DynamicArrayView":
+        """
+        Returns a view of part of this view without copying it
+
+        Parameters:
+        Two ints
+
+        Returns:
+        a DynamicArrayView
+        """
+        if size < 0 or start_index < 0 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        #shares whichever storage this view currently reads, with the owner of that storage
+        owner = self._source if self._source is not None else self
+        return DynamicArrayView(owner, self._data, self._start + start_index, size)
+
+    def slice(self, start_index: int, size: int) -> DynamicArray:
+        """
+        Returns a new array copied from part of the view
+
+        Parameters:
+        Two ints
+
+        Returns:
+        new dynamic array
+        """
+        if size < 0 or start_index < 0 or start_index > self._size - 1 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        return DynamicArray.from_iterable(self.view(start_index, size), typecode=self._typecode,
+                                          policy=self._policy, size_hint=size)
+
+    def to_dynamic_array(self) -> DynamicArray:
+        """
+        Returns a new, independent array with the contents of the view
+
+        Parameters:
+        nothing
+
+        Returns:
+        new dynamic array
+        """
+        return DynamicArray.from_iterable(self, typecode=self._typecode, policy=self._policy,
+                                          size_hint=self._size)
+
+    def map(self, map_func) -> DynamicArray:
+        """
+        returns a new array with each value of the view being put into the passed in function
+
+        Parameters:
+        A function
+
+        Returns:
+        new dynamic array
+        """
+        return DynamicArray.from_iterable((map_func(value) for value in self), policy=self._policy,
+                                          size_hint=self._size)
+
+    def filter(self, filter_func) -> DynamicArray:
+        """
+        returns a new array with each value of the view that satisfies the function
+
+        Parameters:
+        A function
+
+        Returns:
+        new dynamic array
+        """
+        return DynamicArray.from_iterable((value for value in self if filter_func(value)),
+                                          typecode=self._typecode, policy=self._policy)
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        returns an object with the passed in function being applied sequentially over the view
+
+        Parameters:
+        A function and optional initializer
+
+        Returns:
+        an object
+        """
+        if self._size == 0:
+            return initializer
+
+        values = self._data._data
+        if initializer is None:
+            accumulator = values[self._start]
+            start = 1
+        else:
+            accumulator = initializer
+            start = 0
+
+        for i in range(self._start + start, self._start + self._size):
+            accumulator = reduce_func(accumulator, values[i])
+
+        return accumulator
+
+
+class DynamicArraySnapshot(DynamicArrayView):
+    """
+    Read-only view of a DynamicArray frozen at the time it was taken,
+    created by DynamicArray.snapshot() or by viewing another snapshot
+
+    Reads go to the shared storage, except for blocks the snapshot copied
+    because the source was about to change them. Writing raises
+    DynamicArrayException.
+    """
+
+    def __init__(self, source, storage, start: int, size: int, blocks=None) -> None:
+        """
+        Initialize new snapshot of size elements of storage, starting at start
         """
-        if index < 0 or index >= self._size:
-            raise DynamicArrayException
-        self._data[index] = value
+        super().__init__(source, storage, start, size)
+        # copied blocks by block number of the shared storage
+        self._blocks = {} if blocks is None else blocks
+        self._copy_count = 0
 
-    def __getitem__(self, index) -> object:
+    def __str__(self) -> str:
         """
-        Same functionality as get_at_index() method above,
-        but called using array[index] syntax
+        Return content of snapshot in human-readable form
         """
-        return self.get_at_index(index)
+        out = "DYN_ARR_SNAPSHOT Size: " + str(self._size) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
 
-    def __setitem__(self, index, value) -> None:
+    def __iter__(self):
         """
-        Same functionality as set_at_index() method above,
-        but called using array[index] syntax
+        Iterate over the values in the snapshot
         """
-        self.set_at_index(index, value)
+        blocks = self._blocks
+        mask = (1 << _SNAPSHOT_SHIFT) - 1
+        for position in range(self._start, self._start + self._size):
+            #looks the block up each step, since the source may write mid-loop
+            block = blocks.get(position >> _SNAPSHOT_SHIFT)
+            yield self._data._data[position] if block is None else block[position & mask]
 
-    def is_empty(self) -> bool:
+    def get_at_index(self, index: int) -> object:
         """
-        Return True is array is empty / False otherwise
+        Return value from given index position of the snapshot
+        Invalid index raises DynamicArrayException
         """
-        return self._size == 0
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        position = self._start + index
+        block = self._blocks.get(position >> _SNAPSHOT_SHIFT)
+        if block is None:
+            return self._data._data[position]
+        return block[position & ((1 << _SNAPSHOT_SHIFT) - 1)]
 
-    def length(self) -> int:
+    def set_at_index(self, index: int, value: object) -> None:
         """
-        Return number of elements stored in array
+        Snapshots are immutable, so this always raises DynamicArrayException
         """
-        return self._size
+        raise DynamicArrayException
 
-    def get_capacity(self) -> int:
+    def is_shared(self) -> bool:
         """
-        Return the capacity of the array
+        Return True while part of the snapshot is still read from the source's storage
         """
-        return self._capacity
+        first = self._start >> _SNAPSHOT_SHIFT
+        last = (self._start + self._size - 1) >> _SNAPSHOT_SHIFT
+        return any(number not in self._blocks for number in range(first, last + 1))
 
-    def print_da_variables(self) -> None:
+    def get_copy_count(self) -> int:
         """
-        Print information contained in the dynamic array.
-        Used for testing purposes.
+        Return the number of elements this snapshot copied out of the shared storage
         """
-        print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
+        return self._copy_count
 
-    # -----------------------------------------------------------------------
-    
-    def resize(self, new_capacity: int) -> None:
+    def _before_source_write(self, storage, start: int, end: int) -> None:
         """
-        Changes the capacity of the dynamic array to the number passed in
-
-        Parameters:
-        An int
-
-        Returns:
-        nothing
+        Called by the source before it writes positions start..end-1 of storage;
+        copies the blocks of the window that overlap them
         """
-        #checks eligibility
-        if new_capacity < 1 or new_capacity < self._size:
+        if storage is not self._data:
+            return
+        start = max(start, self._start)
+        end = min(end, self._start + self._size)
+        if start >= end:
             return
-        
-        self._capacity = new_capacity
-
-        new_arr = StaticArray(self._capacity)
-
-        for i in range(self._size):
-            #copies data
-            new_arr[i] = self._data[i]
-
-        self._data = new_arr
 
-    def append(self, value: object) -> None:
+        buffer = storage._data
+        block_size = 1 << _SNAPSHOT_SHIFT
+        for number in range(start >> _SNAPSHOT_SHIFT, ((end - 1) >> _SNAPSHOT_SHIFT) + 1):
+            if number in self._blocks:
+                continue
+            #only the part of the block inside the window is needed
+            lo = max(number << _SNAPSHOT_SHIFT, self._start)
+            hi = min((number + 1) << _SNAPSHOT_SHIFT, self._start + self._size)
+            offset = lo & (block_size - 1)
+            block = _scratch(buffer, block_size)
+            if self._typecode is None:
+                block[offset:offset + hi - lo] = buffer[lo:hi]
+            else:
+                #memoryview copies work for arrays and memory-mapped storage alike
+                memoryview(block)[offset:offset + hi - lo] = memoryview(buffer)[lo:hi]
+            self._blocks[number] = block
+            self._copy_count += hi - lo
+
+    def view(self, start_index: int, size: int) -> "DynamicArraySnapshot":
         """
-        Adds an object to the end of the array, increasing capacity as necessary
+        Returns a snapshot of part of this snapshot without copying it
 
         Parameters:
-        An object
+        Two ints
 
         Returns:
-        nothing
-        """
-        if self._capacity == self._size:
-            #resize if necessary
-            self.resize(self._capacity * 2)
-
-        self._size += 1
-        
-        self[self._size - 1] = value
-
-    def insert_at_index(self, index: int, value: object) -> None:
+        a DynamicArraySnapshot
         """
-        Inserts new object at specified index. shifting other elements right
-
-        Parameters:
-        An int and object
-
-        Returns:
-        nothing
-        """    
-
-        if self._capacity == self._size:
-            self.resize(self._capacity * 2)
-
-        if index < 0 or index >= self._size + 1:
+        if size < 0 or start_index < 0 or start_index + size > self._size:
             raise DynamicArrayException
 
-        self._size += 1
-        
-        #new variable for current number
-        current = self[index]
-        self[index] = value
-
-        for i in range(index + 1, self._size):
-            temp = self[i]
-            self[i] = current
-            current = temp
+        #copied blocks are never written again, so the new snapshot can share them
+        return DynamicArraySnapshot(self._source, self._data, self._start + start_index, size, dict(self._blocks))
 
-    def remove_at_index(self, index: int) -> None:
+    def reduce(self, reduce_func, initializer=None) -> object:
         """
-        Removes object at specified index, moving other elements left
+        returns an object with the passed in function being applied sequentially over the snapshot
 
         Parameters:
-        An int
+        A function and optional initializer
 
         Returns:
-        nothing
+        an object
         """
+        values = iter(self)
+        accumulator = initializer
+        if accumulator is None:
+            for accumulator in values:
+                break
+            else:
+                return initializer
 
-        #checks conditions
-        if(self._size < float(self._capacity) / 4 and self._capacity > 10):
-            self.resize(self._size * 2)
-            if(self._capacity < 10):
-                self.resize(10)
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
 
-        self[index] = None
+        return accumulator
 
-        for i in range(index, self._size - 1):
-            self[i] = self[i + 1]
 
-        self._size -= 1
+class LazyPipeline:
+    """
+    Lazy chain of map and filter stages over any iterable source
 
-    def slice(self, start_index: int, size: int) -> "DynamicArray":
-        """
-        Returns a new array with specified starting index of old array and size
+    Stages are only recorded until reduce(), collect() or iteration runs
+    them. Every value then passes through all stages in a single pass, so
+    no intermediate arrays are built. Sources may be DynamicArrays, views
+    or plain iterators, which allows streaming input.
+    """
 
-        Parameters:
-        Two ints
+    _MAP = 0
+    _FILTER = 1
 
-        Returns:
-        new dynamic array
+    def __init__(self, source, stages=()) -> None:
         """
+        Initialize new pipeline reading from source
+        """
+        self._source = source
+        self._stages = stages
 
-        #checks conditions to throw exception
-        if size < 0 or start_index < 0 or start_index > self._size - 1 or start_index + size > self._size:
-            raise DynamicArrayException
-
-        new_arr = DynamicArray()
-
-        for i in range(size):
-            new_arr.append(self[start_index + i])
-
-        return new_arr
+    def __str__(self) -> str:
+        """
+        Return description of the pipeline in human-readable form
+        """
+        names = ['map' if kind == LazyPipeline._MAP else 'filter' for kind, _ in self._stages]
+        return "LAZY_PIPELINE [" + ' -> '.join(['source'] + names) + ']'
 
-    def merge(self, second_da: "DynamicArray") -> None:
+    def map(self, map_func) -> "LazyPipeline":
         """
-        Adds a new array to the existing one
+        returns a new pipeline that also puts each value through map_func
 
         Parameters:
-        A second array
+        A function
 
         Returns:
-        nothing
+        a LazyPipeline
         """
-        for i in range(second_da._size):
-            #uses append to add new values iteratively
-            self.append(second_da[i])
+        return LazyPipeline(self._source, self._stages + ((LazyPipeline._MAP, map_func),))
 
-    def map(self, map_func) -> "DynamicArray":
+    def filter(self, filter_func) -> "LazyPipeline":
         """
-        returns a new array with each value being put into the passed in function
+        returns a new pipeline that also drops values not satisfying filter_func
 
         Parameters:
         A function
 
         Returns:
-        new dynamic array
+        a LazyPipeline
         """
-        
-        new_arr = DynamicArray()
-
-        for i in range(self._size):
-            #adds new values after pass through function
-            new_arr.append(map_func(self[i]))
+        return LazyPipeline(self._source, self._stages + ((LazyPipeline._FILTER, filter_func),))
 
-        return new_arr
+    def __iter__(self):
+        """
+        Run all stages over the source in a single pass, yielding surviving values
+        """
+        stages = self._stages
+        for value in self._source:
+            for kind, func in stages:
+                if kind == LazyPipeline._MAP:
+                    value = func(value)
+                elif not func(value):
+                    break
+            else:
+                yield value
 
-    def filter(self, filter_func) -> "DynamicArray":
+    def reduce(self, reduce_func, initializer=None) -> object:
         """
-        returns a new array with each value that satisfies the function staying in
+        runs the pipeline and combines its values like DynamicArray.reduce
 
         Parameters:
-        A function
+        A function and optional initializer
 
         Returns:
-        new dynamic array
+        an object
         """
-        new_arr = DynamicArray()
+        values = iter(self)
+        accumulator = initializer
+        if accumulator is None:
+            for accumulator in values:
+                break
+            else:
+                #nothing came out of the pipeline
+                return None
 
-        for i in range(self._size):
-            if filter_func(self[i]):
-                #appends values that pass test
-                new_arr.append(self[i])
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
 
-        return new_arr
+        return accumulator
 
-    def reduce(self, reduce_func, initializer=None) -> object:
+    def collect(self, typecode=None, policy=None) -> DynamicArray:
         """
-        returns an object with the passed in function being applied sequentially
+        runs the pipeline and stores its values in a new array
 
         Parameters:
-        A function and optional initializer
+        optional typecode and growth policy of the new array
 
         Returns:
-        an object
+        new dynamic array
         """
-        #edge case
-        if self._size == 0:
-            return initializer
-
-        if initializer == None:
-            initializer = self[0]
-            start = 1
-        else:
-            start = 0
-
-        accumulator = initializer
-        for i in range(start, self._size):
-            #repeats process with itself
-            accumulator = reduce_func(accumulator, self[i])
+        return DynamicArray.from_iterable(self, typecode=typecode, policy=policy)
 
-        return accumulator
 
 def find_mode(arr: DynamicArray) -> (DynamicArray, int):
     """
@@ -344,6 +1947,131 @@ def find_mode(arr: DynamicArray) -> (DynamicArray, int):
     return (mode, max_freq)
 
 
+class ModeTracker:
+    """
+    Incremental mode counter for streams of hashable values
+
+    Values can be fed in chunks with update(); modes() reports the current
+    modes and their frequency at any time. Counts only grow, so the modes
+    are maintained as values arrive instead of being recomputed.
+    """
+
+    def __init__(self, start_values=None) -> None:
+        """
+        Initialize new tracker, counting start_values if provided
+        """
+        self._counts = {}
+        self._modes = {}
+        self._max_freq = 0
+        self._total = 0
+
+        if start_values is not None:
+            self.update(start_values)
+
+    def __str__(self) -> str:
+        """
+        Return current modes in human-readable form
+        """
+        modes, frequency = self.modes()
+        return "MODES: " + str(modes) + " Frequency: " + str(frequency)
+
+    def add(self, value: object) -> None:
+        """
+        counts one value
+
+        Parameters:
+        A hashable object
+
+        Returns:
+        nothing
+        """
+        self.update((value,))
+
+    def update(self, values) -> None:
+        """
+        counts every value of a chunk (any iterable, e.g. a DynamicArray)
+        If a value raises (e.g. it is unhashable), the values before it
+        stay counted and the tracker remains consistent
+
+        Parameters:
+        An iterable
+
+        Returns:
+        nothing
+        """
+        counts = self._counts
+        modes = self._modes
+        max_freq = self._max_freq
+        total = 0
+
+        try:
+            for value in values:
+                count = counts.get(value, 0) + 1
+                counts[value] = count
+                total += 1
+                if count > max_freq:
+                    #a new highest frequency replaces all previous modes
+                    max_freq = count
+                    modes = {value: None}
+                elif count == max_freq:
+                    modes[value] = None
+        finally:
+            #writes back what was counted even if a value raised
+            self._modes = modes
+            self._max_freq = max_freq
+            self._total += total
+
+    def modes(self) -> (DynamicArray, int):
+        """
+        returns the current modes, in the order they reached the top frequency, and that frequency
+
+        Parameters:
+        nothing
+
+        Returns:
+        tuple (dynamic array, int)
+        """
+        return (DynamicArray(self._modes), self._max_freq)
+
+    def frequency(self, value: object) -> int:
+        """
+        returns how many times value has been counted
+
+        Parameters:
+        A hashable object
+
+        Returns:
+        an int
+        """
+        return self._counts.get(value, 0)
+
+    def total(self) -> int:
+        """
+        returns how many values have been counted
+
+        Parameters:
+        nothing
+
+        Returns:
+        an int
+        """
+        return self._total
+
+
+def find_mode_unsorted(arr: DynamicArray) -> (DynamicArray, int):
+    """
+    returns a tuple containing an array of the modes and their frequency,
+    counting in one pass with a hash table, so the input need not be sorted
+
+    Parameters:
+    A dynamic array (or any iterable of hashable values)
+
+    Returns:
+    tuple (dynamic array, int)
+    """
+    return ModeTracker(arr).modes()
+
+
 # ------------------- BASIC TESTING -----------------------------------------
 
 
@@ -599,3 +2327,158 @@ if __name__ == "__main__":
         da.append(case[x])
         mode, frequency = find_mode(da)
         print(f"{da}\nMode: {mode}, Frequency: {frequency}")
+
+    print("\n# typed storage - example 1")
+    da = DynamicArray([1, 2, 3, 4, 5], typecode='q')
+    da.print_da_variables()
+    da.insert_at_index(2, 100)
+    da.remove_at_index(0)
+    print(da, da.get_typecode())
+    print(da.slice(1, 3), da.filter(lambda x: x > 3).get_typecode())
+    print(da.map(lambda x: x / 2), da.reduce(lambda x, y: x + y))
+    try:
+        da.append("text")
+    except TypeError as e:
+        print("Rejected value:", e)
+    print(da)
+
+    print("\n# growth policy - example 1")
+    da = DynamicArray(policy=GrowthPolicy(growth_factor=1.5, shrink_threshold=0.2, shrink_factor=3, min_capacity=4))
+    for i in range(20):
+        da.append(i)
+    print(da.length(), da.get_capacity(), da.get_resize_count(), da.get_copy_count())
+    for _ in range(17):
+        da.remove_at_index(0)
+    print(da.length(), da.get_capacity(), da.get_resize_count(), da.get_copy_count())
+
+    print("\n# reserve / shrink_to_fit - example 1")
+    da = DynamicArray()
+    da.reserve(1000)
+    for i in range(1000):
+        da.append(i)
+    print(da.length(), da.get_capacity(), da.get_resize_count())
+    for _ in range(10):
+        da.remove_at_index(da.length() - 1)
+    da.shrink_to_fit()
+    print(da.length(), da.get_capacity(), da.get_resize_count())
+
+    print("\n# extend / from_iterable - example 1")
+    da = DynamicArray([1, 2, 3])
+    da.extend(range(4, 10))
+    print(da)
+    da.extend((x * x for x in range(3)), size_hint=3)
+    print(da)
+    da2 = DynamicArray.from_iterable(range(5), typecode='q')
+    da2.merge(da2)
+    print(da2, da2.get_resize_count())
+
+    print("\n# view - example 1")
+    da = DynamicArray([1, 2, 3, 4, 5, 6, 7, 8, 9])
+    da_view = da.view(1, 3)
+    print(da_view, da_view.is_shared())
+    print(da_view.map(lambda x: x * 10), da_view.reduce(lambda x, y: x + y))
+    da[8] = 90
+    print(da_view, da_view.is_shared())
+    da[2] = 30
+    print(da, da_view, da_view.is_shared(), sep="\n")
+    da_view[0] = 0
+    print(da, da_view, sep="\n")
+
+    print("\n# lazy pipeline - example 1")
+    da = DynamicArray([1, 5, 10, 15, 20, 25])
+    pipeline = da.lazy().map(lambda x: x ** 2).filter(lambda x: x > 50)
+    print(pipeline)
+    print(pipeline.collect(), pipeline.reduce(lambda x, y: x + y))
+    print(da.map(lambda x: x ** 2).filter(lambda x: x > 50).reduce(lambda x, y: x + y))
+    stream = LazyPipeline(iter(range(10))).filter(lambda x: x % 3 == 0)
+    print(stream.collect(typecode='q'))
+
+    print("\n# iterator - example 1")
+    da = DynamicArray([1, 2, 3])
+    print([(x, y) for x in da for y in da])
+    print([value for value in reversed(da)])
+    iterator = iter(da)
+    print(next(iterator), next(iterator))
+    da.append(4)
+    print([value for value in iterator])
+
+    print("\n# sort - example 1")
+    da = DynamicArray(["pear", "Fig", "apple", "kiwi", "Date", "plum"])
+    da.sort()
+    print(da)
+    da.sort(key=len, reverse=True)
+    print(da)
+    da = DynamicArray([5, -3, 12, 0, 7, -3, 2], typecode='q')
+    da.sort()
+    print(da)
+
+    print("\n# find_mode_unsorted - example 1")
+    for case in ([4, 1, 3, 1, 4, 2], ["Date", "Fig", "Date", "Apple", "Fig", "Date"], []):
+        da = DynamicArray(case)
+        mode, frequency = find_mode_unsorted(da)
+        print(f"{da}\nMode: {mode}, Frequency: {frequency}")
+
+    print("\n# ModeTracker - example 1")
+    tracker = ModeTracker()
+    for chunk in ([3, 1, 3], DynamicArray([1, 2, 2]), (2, 1)):
+        tracker.update(chunk)
+        print(tracker, tracker.total())
+
+    print("\n# remove_many / remove_if - example 1")
+    da = DynamicArray(range(40))
+    print(da.remove_many([0, 5, 5, 39, 20]), da.length(), da.get_capacity())
+    print(da.remove_if(lambda x: x % 3 != 0), da)
+    try:
+        da.remove_many([1, 100])
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e), da.length())
+
+    print("\n# save / load - example 1")
+    import io
+    for da in (DynamicArray([1.5, -2.25, 3.0], typecode='d'), DynamicArray(["a", (1, 2), None])):
+        file = io.BytesIO()
+        da.save(file)
+        file.seek(0)
+        print(len(file.getvalue()), DynamicArray.load(file))
+    try:
+        DynamicArray.load(io.BytesIO(b"not an array"))
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# snapshot - example 1")
+    da = DynamicArray(range(600), typecode='q')
+    snap = da.snapshot()
+    da.append(600)
+    print(snap.length(), snap.get_copy_count(), snap.is_shared())
+    da[300] = -1
+    print(snap[300], da[300], snap.get_copy_count())
+    da.remove_at_index(0)
+    print(snap[0], da[0], snap.get_copy_count(), snap.is_shared())
+    print(snap.view(295, 10), snap.reduce(lambda x, y: x + y))
+    try:
+        snap[0] = 5
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# memoryview - example 1")
+    import struct
+    da = DynamicArray([1, 2, 3, 4], typecode='i')
+    buffer = da.memoryview()
+    print(buffer.format, buffer.nbytes, struct.unpack_from('<4i', buffer))
+    io.BytesIO(struct.pack('<2i', 10, 20)).readinto(buffer[1:3].cast('B'))
+    print(da)
+    try:
+        DynamicArray(["a"]).memoryview()
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# StaticArrayPool - example 1")
+    from static_array_pool import StaticArrayPool
+    pool = StaticArrayPool()
+    da = DynamicArray(typecode='q', pool=pool)
+    for _ in range(3):
+        for i in range(100):
+            da.append(i)
+        while not da.is_empty():
+            da.remove_at_index(da.length() - 1)
+    print(da.get_capacity(), da.get_resize_count(), pool)
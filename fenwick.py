@@ -0,0 +1,196 @@
+from dynamic_array import DynamicArray, DynamicArrayException
+
+
+class FenwickIndex:
+    """
+    Prefix-sum index (binary indexed tree) over a numeric DynamicArray
+
+    Attaches itself to the array, which keeps it in sync: set_at_index()
+    and append() update the tree in O(log n), and other changes (insert,
+    remove, extend, sort, ...) mark it stale so it is rebuilt in O(n) on
+    the next query. range_sum() and prefix_sum() are O(log n), except while
+    the array has an exported memoryview(): writes through it are not
+    reported, so every query then rebuilds in O(n).
+    Float sums can drift slightly from a fresh sum after many updates;
+    rebuild() recomputes them exactly.
+    """
+
+    def __init__(self, da: DynamicArray) -> None:
+        """
+        Initialize new index over da and attach it
+        """
+        self._source = da
+        # tree[i] holds the sum of the i & -i values ending at position i - 1
+        self._tree = None
+        self._stale = True
+        da.attach_index(self)
+
+    def __str__(self) -> str:
+        """
+        Return content of the index in human-readable form
+        """
+        self._refresh()
+        out = "FENWICK_INDEX Size: " + str(self._source.length()) + ' ['
+        out += ', '.join([str(self._prefix(i)) for i in range(1, self._source.length() + 1)])
+        return out + ']'
+
+    def detach(self) -> None:
+        """
+        Stops tracking the array; queries afterwards see the values at this point
+        """
+        self._refresh()
+        self._source.detach_index(self)
+
+    def length(self) -> int:
+        """
+        Return number of values covered by the index
+        """
+        self._refresh()
+        return self._tree.length() - 1
+
+    # ------------------------------------------------------------------ #
+
+    def rebuild(self) -> None:
+        """
+        Builds the tree from the current values of the array in O(n)
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        source = self._source
+        n = source.length()
+        values = source._data._data
+        typecode = 'd' if source.get_typecode() in ('f', 'd') else None
+
+        self._tree = DynamicArray(typecode=typecode)
+        self._tree.reserve(n + 1)
+        self._tree.append(0)
+        self._tree.extend(values[i] for i in range(n))
+
+        #pushes every node's total into its parent
+        tree = self._tree._data._data
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+        self._stale = False
+
+    def _refresh(self) -> None:
+        """
+        Rebuilds the tree if the array changed in a way it did not track,
+        or on every query while the array's storage is exported as a memoryview
+        """
+        if self._stale or self._source._exported:
+            self.rebuild()
+
+    def _invalidate(self) -> None:
+        """
+        Called by the array after a change the tree does not track
+        """
+        self._stale = True
+        self._tree = None
+
+    def _element_set(self, index: int, old, new) -> None:
+        """
+        Called by the array after the value at index changed from old to new
+        """
+        if self._stale:
+            return
+
+        delta = new - old
+        tree = self._tree._data._data
+        n = self._tree.length() - 1
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def _element_appended(self, value) -> None:
+        """
+        Called by the array after value was appended
+        """
+        if self._stale:
+            return
+
+        #the new node covers the previous (i & -i) - 1 values plus the new one
+        i = self._tree.length()
+        self._tree.append(value + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+
+    def _prefix(self, count: int):
+        """
+        Returns the sum of the first count values, with the tree up to date
+        """
+        tree = self._tree._data._data
+        total = 0
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def prefix_sum(self, count: int):
+        """
+        Returns the sum of the first count values of the array in O(log n)
+
+        Parameters:
+        An int between 0 and the array length
+
+        Returns:
+        the sum (0 for count 0)
+        """
+        self._refresh()
+        if count < 0 or count >= self._tree.length():
+            raise DynamicArrayException
+        return self._prefix(count)
+
+    def range_sum(self, lo: int, hi: int):
+        """
+        Returns the sum of the values at indices lo..hi-1 in O(log n)
+
+        Parameters:
+        Two ints with 0 <= lo <= hi <= array length
+
+        Returns:
+        the sum (0 for an empty range)
+        """
+        self._refresh()
+        if lo < 0 or hi < lo or hi >= self._tree.length():
+            raise DynamicArrayException
+        return self._prefix(hi) - self._prefix(lo)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# range_sum / prefix_sum - example 1")
+    da = DynamicArray([5, 3, -2, 8, 1, 4], typecode='q')
+    index = FenwickIndex(da)
+    print(index, index.range_sum(1, 4), index.prefix_sum(0))
+
+    print("\n# kept in sync with set_at_index / append - example 1")
+    da[2] = 10
+    da.append(7)
+    print(index.range_sum(1, 4), index.range_sum(0, da.length()), index.length())
+
+    print("\n# rebuilt after other changes - example 1")
+    da.insert_at_index(0, 100)
+    da.remove_at_index(3)
+    print(da, index.range_sum(0, 3), index.prefix_sum(da.length()))
+
+    print("\n# float values - example 1")
+    da = DynamicArray([0.5, 1.25, 2.0], typecode='d')
+    index = FenwickIndex(da)
+    da[0] = 1.5
+    print(index.range_sum(0, 2), index.range_sum(2, 3))
+
+    print("\n# index errors - example 1")
+    for lo, hi in ((-1, 2), (2, 1), (0, 4)):
+        try:
+            index.range_sum(lo, hi)
+        except DynamicArrayException as e:
+            print("Exception raised:", type(e))
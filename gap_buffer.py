@@ -0,0 +1,340 @@
+from static_array import StaticArray
+from static_array_ops import copy_range, fill
+from dynamic_array import DynamicArrayException, DEFAULT_POLICY
+
+
+class GapBufferArray:
+    """
+    Dynamic array that keeps its free capacity as a gap at the last edit position
+
+    Supports the DynamicArray API. Elements before the gap are stored at the
+    front of the StaticArray and elements after it at the back, so inserting
+    or removing next to the previous edit only moves the gap boundary.
+    Edits k positions away from the gap cost O(k) to move the gap there.
+    """
+
+    def __init__(self, start_array=None, policy=None) -> None:
+        """
+        Initialize new gap buffer array
+        """
+        self._capacity = 4
+        self._policy = policy if policy is not None else DEFAULT_POLICY
+        self._data = StaticArray(self._capacity)
+
+        # the gap occupies physical positions gap_start..gap_end-1
+        self._gap_start = 0
+        self._gap_end = self._capacity
+
+        if start_array is not None:
+            for value in start_array:
+                self.append(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of gap buffer array in human-readable form
+        """
+        out = "GAP_ARR Size/Cap: "
+        out += str(self.length()) + "/" + str(self._capacity) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the values on both sides of the gap
+        """
+        data = self._data
+        for i in range(self._gap_start):
+            yield data[i]
+        for i in range(self._gap_end, self._capacity):
+            yield data[i]
+
+    def _physical(self, index: int) -> int:
+        """
+        Return the storage position of a logical index
+        """
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.length():
+            raise DynamicArrayException
+        return self._data[self._physical(index)]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.length():
+            raise DynamicArrayException
+        self._data[self._physical(index)] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index(), using array[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index(), using array[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True if array is empty / False otherwise
+        """
+        return self.length() == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in array
+        """
+        return self._capacity - (self._gap_end - self._gap_start)
+
+    def get_capacity(self) -> int:
+        """
+        Return the capacity of the array
+        """
+        return self._capacity
+
+    def get_gap_position(self) -> int:
+        """
+        Return the logical index where the gap currently sits
+        """
+        return self._gap_start
+
+    # ------------------------------------------------------------------ #
+
+    def _move_gap(self, index: int) -> None:
+        """
+        moves the gap so that it starts at the given logical index
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        data = self._data
+        if self._gap_start == self._gap_end:
+            #an empty gap can sit anywhere without moving elements
+            self._gap_start = self._gap_end = index
+        elif index < self._gap_start:
+            #shifts the elements between index and the gap to the back side
+            count = self._gap_start - index
+            copy_range(data, index, data, self._gap_end - count, count)
+            fill(data, index, min(count, self._gap_end - self._gap_start), None)
+            self._gap_start -= count
+            self._gap_end -= count
+        elif index > self._gap_start:
+            #shifts elements after the gap to the front side
+            count = index - self._gap_start
+            copy_range(data, self._gap_end, data, self._gap_start, count)
+            fill(data, max(self._gap_end, self._gap_start + count), min(count, self._gap_end - self._gap_start), None)
+            self._gap_start += count
+            self._gap_end += count
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the array, keeping the gap at its logical position
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        size = self.length()
+        if new_capacity < 1 or new_capacity < size:
+            return
+
+        new_arr = StaticArray(new_capacity)
+        tail = self._capacity - self._gap_end
+
+        copy_range(self._data, 0, new_arr, 0, self._gap_start)
+        copy_range(self._data, self._gap_end, new_arr, new_capacity - tail, tail)
+
+        self._data = new_arr
+        self._capacity = new_capacity
+        self._gap_end = new_capacity - tail
+
+    def append(self, value: object) -> None:
+        """
+        Adds an object to the end of the array, increasing capacity as necessary
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        self.insert_at_index(self.length(), value)
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Inserts new object at specified index, moving the gap there first
+
+        Parameters:
+        An int and object
+
+        Returns:
+        nothing
+        """
+        size = self.length()
+        if index < 0 or index > size:
+            raise DynamicArrayException
+
+        if self._gap_start == self._gap_end:
+            self.resize(self._policy.grow(self._capacity, size + 1))
+
+        self._move_gap(index)
+        self._data[self._gap_start] = value
+        self._gap_start += 1
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes object at specified index by widening the gap over it
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        if index < 0 or index >= self.length():
+            raise DynamicArrayException
+
+        self._move_gap(index)
+        self._data[self._gap_end] = None
+        self._gap_end += 1
+
+        new_capacity = self._policy.shrink(self.length(), self._capacity)
+        if new_capacity is not None:
+            self.resize(new_capacity)
+
+    def slice(self, start_index: int, size: int) -> "GapBufferArray":
+        """
+        Returns a new array with specified starting index of old array and size
+
+        Parameters:
+        Two ints
+
+        Returns:
+        new gap buffer array
+        """
+        length = self.length()
+        if size < 0 or start_index < 0 or start_index > length - 1 or start_index + size > length:
+            raise DynamicArrayException
+
+        new_arr = GapBufferArray(policy=self._policy)
+        for i in range(start_index, start_index + size):
+            new_arr.append(self._data[self._physical(i)])
+
+        return new_arr
+
+    def merge(self, second_da) -> None:
+        """
+        Adds the values of another array to the end of this one
+
+        Parameters:
+        A second array
+
+        Returns:
+        nothing
+        """
+        for i in range(second_da.length()):
+            self.append(second_da[i])
+
+    def map(self, map_func) -> "GapBufferArray":
+        """
+        returns a new array with each value being put into the passed in function
+
+        Parameters:
+        A function
+
+        Returns:
+        new gap buffer array
+        """
+        new_arr = GapBufferArray(policy=self._policy)
+        for value in self:
+            new_arr.append(map_func(value))
+
+        return new_arr
+
+    def filter(self, filter_func) -> "GapBufferArray":
+        """
+        returns a new array with each value that satisfies the function staying in
+
+        Parameters:
+        A function
+
+        Returns:
+        new gap buffer array
+        """
+        new_arr = GapBufferArray(policy=self._policy)
+        for value in self:
+            if filter_func(value):
+                new_arr.append(value)
+
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        returns an object with the passed in function being applied sequentially
+
+        Parameters:
+        A function and optional initializer
+
+        Returns:
+        an object
+        """
+        values = iter(self)
+        accumulator = initializer
+        if accumulator is None:
+            for accumulator in values:
+                break
+            else:
+                return initializer
+
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
+
+        return accumulator
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# insert_at_index / remove_at_index - example 1")
+    ga = GapBufferArray("hello world")
+    print(ga, ga.get_gap_position())
+    for i, letter in enumerate("big "):
+        ga.insert_at_index(6 + i, letter)
+    print(''.join(ga), ga.get_gap_position())
+    for _ in range(4):
+        ga.remove_at_index(5)
+    print(''.join(ga), ga.get_gap_position())
+
+    print("\n# index errors - example 1")
+    ga = GapBufferArray([1, 2, 3])
+    for index in (-1, 4):
+        try:
+            ga.insert_at_index(index, 0)
+        except DynamicArrayException as e:
+            print("Exception raised:", type(e))
+
+    print("\n# slice / map / filter / reduce - example 1")
+    ga = GapBufferArray([1, 5, 10, 15, 20, 25])
+    ga.insert_at_index(2, 7)
+    print(ga)
+    print(ga.slice(1, 3), ga.map(lambda x: x * 2))
+    print(ga.filter(lambda x: x > 9), ga.reduce(lambda x, y: x + y))
@@ -3,11 +3,13 @@ from include import (DynamicArray, DynamicArrayException, HashEntry,
 
 
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    def __init__(self, capacity: int, function, entry_type=HashEntry) -> None:
         """
         Initialize new HashMap that uses
         quadratic probing for collision resolution
+        entry_type builds the entries, e.g. compact_nodes.CompactHashEntry
         """
+        self._entry_type = entry_type
         self._buckets = DynamicArray()
 
         # capacity must be a prime number
@@ -99,7 +101,7 @@ class HashMap:
             i += 1
 
         if self._buckets[current_index] is None:
-            self._buckets[current_index] = HashEntry(key, value)
+            self._buckets[current_index] = self._entry_type(key, value)
             self._size += 1
 
         elif self._buckets[current_index].is_tombstone is True:
@@ -1,21 +1,24 @@
-from include import (DynamicArray, LinkedList,
+from include import (DynamicArray, LinkedList, SLNode,
                         hash_function_1, hash_function_2)
 
 
 class HashMap:
     def __init__(self,
                  capacity: int = 11,
-                 function: callable = hash_function_1) -> None:
+                 function: callable = hash_function_1,
+                 node_type=SLNode) -> None:
         """
         Initialize new HashMap that uses
         separate chaining for collision resolution
+        node_type builds the chain nodes, e.g. compact_nodes.CompactChainNode
         """
+        self._node_type = node_type
         self._buckets = DynamicArray()
 
         # capacity must be a prime number
         self._capacity = self._next_prime(capacity)
         for _ in range(self._capacity):
-            self._buckets.append(LinkedList())
+            self._buckets.append(LinkedList(self._node_type))
 
         self._hash_function = function
         self._size = 0
@@ -147,7 +150,7 @@ class HashMap:
 
         #sets each buckets to a new linked list to clear all data
         for i in range(self._capacity):
-            self._buckets[i] = LinkedList()
+            self._buckets[i] = LinkedList(self._node_type)
 
         self._size = 0
 
@@ -172,7 +175,7 @@ class HashMap:
         #creates new da with the new capacity number of buckets
         new_buckets = DynamicArray()
         for i in range(new_capacity):
-            new_buckets.append(LinkedList())
+            new_buckets.append(LinkedList(self._node_type))
 
         old_buckets = self._buckets
         old_capacity = self._capacity
@@ -136,11 +136,13 @@ class LinkedList:
     Supported methods are: insert, remove, contains, length, iterator
     """
 
-    def __init__(self) -> None:
+    def __init__(self, node_type=SLNode) -> None:
         """
         Initialize new linked list;
         doesn't use a sentinel and keeps track of its size in a variable.
+        node_type builds the nodes, e.g. compact_nodes.CompactChainNode
         """
+        self._node_type = node_type
         self._head = None
         self._size = 0
 
@@ -162,7 +164,7 @@ class LinkedList:
 
     def insert(self, key: str, value: object) -> None:
         """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+        self._head = self._node_type(key, value, self._head)
         self._size += 1
 
     def remove(self, key: str) -> bool:
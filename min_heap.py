@@ -43,11 +43,15 @@ class MinHeap:
 
         current = self._heap.length() - 1
 
+        #every index on the path to the root is in range, so the unchecked accessors are used
+        get = self._heap._get_unchecked
+        put = self._heap._set_unchecked
+
         #percolates up to find right spot
         while current != 0:
-            if self._heap[(current - 1) // 2] > node:
-                self._heap[current] = self._heap[(current - 1) // 2]
-                self._heap[(current - 1) // 2] = node
+            if get((current - 1) // 2) > node:
+                put(current, get((current - 1) // 2))
+                put((current - 1) // 2, node)
                 current = (current - 1) // 2
             else:
                 break
@@ -189,14 +193,17 @@ def heapsort(da: DynamicArray) -> None:
 
     border = da.length() - 1
 
+    get = da._get_unchecked
+    put = da._set_unchecked
+
     #continue until border is 0
     while border >= 1:
-        temp = da[border]
+        temp = get(border)
 
         #swaps first value and value by border to get lowest values towards end of heap
-        da[border] = da[0]
+        put(border, get(0))
 
-        da[0] = temp
+        put(0, temp)
 
         #percolate helper function
 
@@ -230,44 +237,49 @@ def _percolate_down(da: DynamicArray, parent: int, border: int) -> None:
     nothing
     """
 
+    #the length is read once and every index below is checked against it,
+    #so the unchecked accessors skip the public bounds checks
+    get = da._get_unchecked
+    put = da._set_unchecked
+    length = da.length()
+
     while True:
 
-        two_children = 0
+        left = 2 * parent + 1
+        right = left + 1
 
         #checks if the smaller of the two children is beyond the eligible bounds
-        if 2 * parent + 1 >= da.length() or (2 * parent + 1 >= border and border != -1):
+        if left >= length or (left >= border and border != -1):
             return
-        
-        #checks if the parent has two children
-        if 2 * parent + 2 < da.length():
-            two_children = 1
 
-        if two_children == 1:
+        value = get(parent)
+        left_value = get(left)
+
+        #checks if the parent has two children
+        if right < length:
+            right_value = get(right)
             #checks if at aleast one child is less than parent
-            if da[2 * parent + 1] < da[parent] or da[2 * parent + 2] < da[parent]:
+            if left_value < value or right_value < value:
                 #if right child is least
-                if da[2 * parent + 2] < da[2 * parent + 1] and (2 * parent + 2 < border or border == -1):
-                    temp = da[parent]
-                    da[parent] = da[2 * parent + 2]
-                    da[2 * parent + 2] = temp
-                    parent = 2 * parent + 2
+                if right_value < left_value and (right < border or border == -1):
+                    put(parent, right_value)
+                    put(right, value)
+                    parent = right
                 #if left child is least
-                elif da[2 * parent + 2] >= da[2 * parent + 1]:
-                    temp = da[parent]
-                    da[parent] = da[2 * parent + 1]
-                    da[2 * parent + 1] = temp
-                    parent = 2 * parent + 1
+                elif right_value >= left_value:
+                    put(parent, left_value)
+                    put(left, value)
+                    parent = left
                 else:
                     return
             else:
                 return
         #if only one child
         else:
-            if da[2 * parent + 1] < da[parent]:
-                    temp = da[parent]
-                    da[parent] = da[2 * parent + 1]
-                    da[2 * parent + 1] = temp
-                    parent = 2 * parent + 1
+            if left_value < value:
+                put(parent, left_value)
+                put(left, value)
+                parent = left
             else:
                 return
 
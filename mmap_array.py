@@ -0,0 +1,413 @@
+import mmap
+import os
+import struct
+
+from static_array import StaticArrayException
+from dynamic_array import DynamicArray, DynamicArrayException
+
+
+# file layout: one header page followed by the raw elements, so the data
+# starts page aligned and reopening only has to read the header
+_MAGIC = b'DAMM'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBc2xqq')
+_HEADER_SIZE = 4096
+
+# typecodes a memoryview can be cast to
+_MMAP_TYPECODES = 'bBhHiIlLqQfd'
+
+
+class MmapStorage:
+    """
+    Fixed-size typed array kept in a memory-mapped file.
+    Implemented methods: get(), set(), length()
+
+    Mirrors the TypedStaticArray interface so it can be used as the backing
+    storage of a DynamicArray. _data is a memoryview over the mapped file,
+    so values are read and written in place by the operating system's
+    page cache instead of being loaded into Python objects.
+    """
+
+    def __init__(self, file, typecode: str, size: int) -> None:
+        """
+        Map the already opened file, which must hold size elements
+        after its header. Use create() or open() instead of calling this.
+        """
+        self._file = file
+        self._typecode = typecode
+        self._itemsize = struct.calcsize(typecode)
+        self._size = size
+        self._map()
+
+    @classmethod
+    def create(cls, path: str, typecode: str, size: int) -> "MmapStorage":
+        """
+        Create (or truncate) the file at path and map size zeroed elements.
+        Typecodes a memoryview cannot use raise DynamicArrayException.
+        """
+        if typecode is None or len(typecode) != 1 or typecode not in _MMAP_TYPECODES:
+            raise DynamicArrayException
+        if size < 1:
+            raise StaticArrayException('Array size must be a positive integer')
+
+        file = open(path, 'w+b')
+        file.write(_HEADER.pack(_MAGIC, _VERSION, typecode.encode(), 0, size))
+        file.truncate(_HEADER_SIZE + size * struct.calcsize(typecode))
+        return cls(file, typecode, size)
+
+    @classmethod
+    def open(cls, path: str) -> "MmapStorage":
+        """
+        Map an existing file without reading its elements.
+        Files that were not written by MmapStorage raise DynamicArrayException.
+        """
+        file = open(path, 'r+b')
+        magic, version, typecode, _, size = _HEADER.unpack(file.read(_HEADER.size).ljust(_HEADER.size, b'\0'))
+        if magic != _MAGIC or version != _VERSION:
+            file.close()
+            raise DynamicArrayException
+
+        return cls(file, typecode.decode(), size)
+
+    def _map(self) -> None:
+        """Map the file and cast the element area to the typecode."""
+        self._mmap = mmap.mmap(self._file.fileno(), _HEADER_SIZE + self._size * self._itemsize)
+        self._data = memoryview(self._mmap)[_HEADER_SIZE:].cast(self._typecode)
+
+    def _unmap(self) -> None:
+        """Release the mapping; fails if memoryviews of it are still in use."""
+        self._data.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            #someone else still holds a buffer over the mapping, keep it usable
+            self._data = memoryview(self._mmap)[_HEADER_SIZE:].cast(self._typecode)
+            raise DynamicArrayException
+
+    def __iter__(self) -> None:
+        """Disable iterator capability, same as StaticArray."""
+        return None
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return f"MMAP_ARR '{self._typecode}' Size: {self._size} {self._data.tolist()}"
+
+    def get(self, index: int):
+        """
+        Return value from given index position.
+        Invalid index raises StaticArrayException.
+        """
+        if index < 0 or index >= self._size:
+            raise StaticArrayException('Index out of bounds')
+        return self._data[index]
+
+    def set(self, index: int, value) -> None:
+        """
+        Store value at given index in the array.
+        Invalid index raises StaticArrayException.
+        Values that do not fit the typecode raise TypeError/ValueError.
+        """
+        if index < 0 or index >= self._size:
+            raise StaticArrayException('Index out of bounds')
+        self._data[index] = value
+
+    def __getitem__(self, index: int):
+        """Enable bracketed indexing."""
+        return self.get(index)
+
+    def __setitem__(self, index: int, value) -> None:
+        """Enable bracketed indexing."""
+        self.set(index, value)
+
+    def length(self) -> int:
+        """Return length of the array (number of elements)."""
+        return self._size
+
+    def typecode(self) -> str:
+        """Return the array.array typecode of the stored elements."""
+        return self._typecode
+
+    def itemsize(self) -> int:
+        """Return the size in bytes of one stored element."""
+        return self._itemsize
+
+    def stored_count(self) -> int:
+        """Return the element count recorded in the header by the last flush()."""
+        return _HEADER.unpack_from(self._mmap)[3]
+
+    def remap(self, size: int) -> None:
+        """
+        Extend or truncate the file to hold size elements and map it again.
+        Elements below both the old and the new size keep their values.
+        """
+        self._unmap()
+        self._file.truncate(_HEADER_SIZE + size * self._itemsize)
+        self._size = size
+        self._map()
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, self._typecode.encode(), self.stored_count(), size)
+
+    def advise(self, option: int) -> None:
+        """Pass an mmap.MADV_* access pattern hint for the mapping, where supported."""
+        if hasattr(self._mmap, 'madvise'):
+            self._mmap.madvise(option)
+
+    def flush(self, count: int) -> None:
+        """Record count in the header and write dirty pages back to the file."""
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, self._typecode.encode(), count, self._size)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._unmap()
+        self._file.close()
+
+
+class MmapDynamicArray(DynamicArray):
+    """
+    Typed DynamicArray whose storage is a memory-mapped file
+
+    Holds more data than fits in memory: only the pages being touched are
+    resident. Growing extends the file and maps it again instead of copying
+    elements. The element count is written to the file by flush() and
+    close(), and reopening the file maps it without reading the elements.
+    """
+
+    def __init__(self, path: str, typecode=None, start_array=None, policy=None) -> None:
+        """
+        Open the array stored at path, or create a new file there
+
+        A new file uses typecode ('q' if not given). Opening an existing
+        file with a different typecode raises DynamicArrayException.
+        """
+        self._path = path
+        super().__init__(typecode=typecode, policy=policy)
+
+        if typecode is not None and self._data.typecode() != typecode:
+            self._data.close()
+            raise DynamicArrayException
+
+        #picks up whatever the file already holds
+        self._typecode = self._data.typecode()
+        self._capacity = self._data.length()
+        self._size = min(self._data.stored_count(), self._capacity)
+
+        if start_array is not None:
+            self.extend(start_array)
+
+    def __getstate__(self) -> dict:
+        """
+        Mapped files are not picklable; flush() the array and reopen its path instead
+        """
+        raise TypeError("cannot pickle MmapDynamicArray")
+
+    def __enter__(self) -> "MmapDynamicArray":
+        """Use the array as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Flush and close the array."""
+        self.close()
+
+    @classmethod
+    def _create(cls, path: str, typecode=None, policy=None) -> "MmapDynamicArray":
+        """
+        Create an empty array in a new file at path; existing files and
+        object arrays (typecode None) raise DynamicArrayException
+        """
+        if typecode is None or (os.path.exists(path) and os.path.getsize(path) > 0):
+            raise DynamicArrayException
+        return cls(path, typecode, policy=policy)
+
+    @classmethod
+    def from_iterable(cls, path: str, values, typecode='q', policy=None, size_hint=None) -> "MmapDynamicArray":
+        """
+        Builds a new array in a new file at path from any iterable, reserving capacity up front
+        Raises DynamicArrayException if path already holds a file
+
+        Parameters:
+        A path, an iterable, optional typecode, growth policy and expected number of values
+
+        Returns:
+        new memory-mapped array
+        """
+        new_arr = cls._create(path, typecode, policy)
+        new_arr.extend(values, size_hint)
+        return new_arr
+
+    @classmethod
+    def load(cls, path: str, path_or_file, policy=None) -> "MmapDynamicArray":
+        """
+        Reads a typed array written by DynamicArray.save() into a new file at path
+        Object arrays, files already at path and invalid input raise DynamicArrayException
+
+        Parameters:
+        A path for the new array, a path or a file opened for binary reading, optional growth policy
+
+        Returns:
+        new memory-mapped array
+        """
+        if isinstance(path_or_file, (str, bytes, os.PathLike)):
+            with open(path_or_file, 'rb') as file:
+                return cls.load(path, file, policy)
+
+        created = []
+
+        def new_array(typecode):
+            created.append(cls._create(path, typecode, policy))
+            return created[0]
+
+        try:
+            return cls._load_from(path_or_file, new_array)
+        except Exception:
+            #a failed load leaves no partly written file behind
+            if created:
+                created[0]._data.close()
+                os.remove(path)
+            raise
+
+    def _new_storage(self, capacity: int) -> MmapStorage:
+        """
+        Map the backing file, creating it if it does not exist yet
+        """
+        if os.path.exists(self._path) and os.path.getsize(self._path) > 0:
+            return MmapStorage.open(self._path)
+        return MmapStorage.create(self._path, self._typecode or 'q', capacity)
+
+    def get_path(self) -> str:
+        """
+        Return the path of the backing file
+        """
+        return self._path
+
+    # -----------------------------------------------------------------------
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Changes the capacity by extending or truncating the file and remapping it
+        Raises DynamicArrayException while a memoryview of the storage is in use
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        #checks eligibility
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        #the elements stay in the file, so nothing is copied
+        self._data.remap(new_capacity)
+        #remap only succeeds once no memoryview holds the old mapping
+        self._exported = False
+        self._capacity = new_capacity
+        self._resize_count += 1
+
+    def flush(self) -> None:
+        """
+        Records the current size in the file and writes changes back to disk
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        self._data.flush(self._size)
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the file; the array cannot be used afterwards
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        self.flush()
+        self._data.close()
+
+    def iter_chunks(self, chunk_size: int = None):
+        """
+        Yields the values in order as read-only memoryviews of chunk_size elements
+
+        Reading the file in page-sized pieces with a sequential access hint
+        lets the operating system read ahead and drop pages already passed.
+        Chunks must not be kept while the array is resized or closed.
+
+        Parameters:
+        optional number of elements per chunk (default: 64 KiB worth)
+
+        Returns:
+        a generator of memoryviews
+        """
+        storage = self._data
+        if chunk_size is None:
+            chunk_size = max(1, 65536 // storage.itemsize())
+        if chunk_size < 1:
+            raise DynamicArrayException
+
+        storage.advise(getattr(mmap, 'MADV_SEQUENTIAL', 0))
+        try:
+            for start in range(0, self._size, chunk_size):
+                yield storage._data[start:min(start + chunk_size, self._size)].toreadonly()
+        finally:
+            storage.advise(getattr(mmap, 'MADV_NORMAL', 0))
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'values.dam')
+
+        print("\n# create / append / resize - example 1")
+        with MmapDynamicArray(path, 'q', range(10)) as ma:
+            for i in range(10, 20):
+                ma.append(i * i)
+            ma.remove_at_index(0)
+            print(ma, ma.get_resize_count(), ma.get_copy_count())
+        print(os.path.getsize(path))
+
+        print("\n# reopen without parsing - example 1")
+        with MmapDynamicArray(path) as ma:
+            print(ma.length(), ma.get_typecode(), ma[0], ma[ma.length() - 1])
+            ma.sort(reverse=True)
+            print(ma.slice(0, 5), ma.reduce(lambda x, y: x + y))
+            print(sum(sum(chunk) for chunk in ma.iter_chunks(4)))
+
+        print("\n# unflushed appends are not recorded - example 1")
+        ma = MmapDynamicArray(path)
+        ma.append(-1)
+        ma.flush()
+        ma.append(-2)
+        ma._data.close()
+        with MmapDynamicArray(path) as ma:
+            print(ma.length(), ma[ma.length() - 1])
+
+        print("\n# from_iterable / load into a new file - example 1")
+        with MmapDynamicArray.from_iterable(path + '.new', range(5), 'd', size_hint=5) as ma:
+            print(ma, ma.get_typecode())
+        saved = DynamicArray(typecode='i')
+        saved.extend(range(3, 8))
+        saved.save(path + '.saved')
+        with MmapDynamicArray.load(path + '.loaded', path + '.saved') as ma:
+            print(ma, ma.get_typecode())
+        DynamicArray(['a', 'b']).save(path + '.objects')
+        for target, source in ((path, path + '.saved'), (path + '.none', path + '.objects')):
+            try:
+                MmapDynamicArray.load(target, source)
+            except DynamicArrayException as e:
+                print("Exception raised:", type(e), os.path.exists(path + '.none'))
+
+        print("\n# typecode errors - example 1")
+        for typecode in ('d', 'u'):
+            try:
+                MmapDynamicArray(path if typecode == 'd' else path + '2', typecode)
+            except DynamicArrayException as e:
+                print("Exception raised:", type(e))
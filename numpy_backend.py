@@ -0,0 +1,153 @@
+"""
+Optional NumPy acceleration for typed DynamicArrays.
+
+Everything here works on the typed storage (TypedStaticArray) of an array
+and is only used when NumPy is installed. Callers fall back to their
+per-element Python loops whenever a helper returns None.
+"""
+import array
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# binary Python callables with a NumPy ufunc that reduces the same way
+_REDUCERS = {
+    operator.add: 'add',
+    operator.mul: 'multiply',
+    min: 'minimum',
+    max: 'maximum',
+}
+
+
+def available() -> bool:
+    """Return True if NumPy could be imported."""
+    return numpy is not None
+
+
+def can_vectorize(func, vectorized: bool = False) -> bool:
+    """
+    Return True if func can be applied to a whole ndarray at once:
+    either it is a NumPy ufunc or the caller promised it is vectorized.
+    """
+    if numpy is None:
+        return False
+    return vectorized or isinstance(func, numpy.ufunc)
+
+
+def as_ndarray(storage, start: int, count: int):
+    """
+    Return a zero-copy ndarray over count elements of typed storage,
+    beginning at index start.
+    """
+    buffer = storage._data
+    dtype = buffer.format if isinstance(buffer, memoryview) else buffer.typecode
+    return numpy.frombuffer(buffer, dtype=dtype, count=count,
+                            offset=start * buffer.itemsize)
+
+
+def typecode_for(values):
+    """
+    Return the array module typecode able to hold the ndarray values
+    without conversion, or None if there is none (bool, complex, ...).
+    """
+    code = values.dtype.char
+    if code in array.typecodes and array.array(code).itemsize == values.dtype.itemsize:
+        return code
+    return None
+
+
+def apply(func, values):
+    """
+    Apply a vectorized func to an ndarray and return a 1-D ndarray
+    with one result per input value.
+    """
+    result = numpy.asarray(func(values))
+    if result.shape != values.shape:
+        # scalar or reshaped results are not element-wise; broadcast scalars
+        result = numpy.broadcast_to(result, values.shape)
+    return result
+
+
+def widened(values):
+    """
+    Return integer values narrower than 64 bits as an int64 ndarray,
+    so ufuncs do not wrap around in the small storage type where the
+    Python loop would produce a larger int; other values are returned as is.
+    """
+    if values.dtype.kind in 'iu' and values.dtype.itemsize < 8:
+        return values.astype(numpy.int64)
+    return values
+
+
+def mask(func, values):
+    """
+    Apply a vectorized predicate to an ndarray and return a boolean mask.
+    """
+    return numpy.broadcast_to(numpy.asarray(func(widened(values)), dtype=bool), values.shape)
+
+
+def reducer_for(func, values, initializer=None):
+    """
+    Return the ufunc that reduces values, starting from initializer,
+    exactly like the Python loop over the binary func, or None if the
+    result could differ.
+
+    Only add, multiply, minimum and maximum (as ufuncs or as operator.add,
+    operator.mul, min and max) qualify, since ufunc.reduce regroups the
+    operations. Float sums and products are left to the loop because NumPy
+    sums pairwise and rounds differently, as are float arrays holding NaN
+    (min and max treat it differently), integer sums that could leave
+    64 bits and integer products. The initializer must be a float for
+    float arrays and an int for integer arrays.
+    """
+    if numpy is None:
+        return None
+
+    try:
+        name = _REDUCERS.get(func)
+    except TypeError:
+        # unhashable callables cannot be known reducers
+        name = None
+    if name is None and isinstance(func, numpy.ufunc) and func.__name__ in _REDUCERS.values():
+        name = func.__name__
+    if name is None:
+        return None
+
+    kind = values.dtype.kind
+    if kind == 'f':
+        if name in ('add', 'multiply') or numpy.isnan(values).any():
+            return None
+        # an int initializer can win min or max and the loop would return it as an int
+        if initializer is not None and type(initializer) is not float:
+            return None
+        return getattr(numpy, name)
+
+    if kind not in 'iu' or (initializer is not None and type(initializer) is not int):
+        return None
+
+    # Python ints never overflow, so only reduce integer storage in bulk
+    # when the result provably fits in 64 bits
+    bound = max(abs(int(values.min())), abs(int(values.max())), abs(initializer or 0))
+    if name == 'multiply' or bound * (len(values) + 1) >= 2 ** 63:
+        return None
+
+    return getattr(numpy, name)
+
+
+def reduce(ufunc, values, initializer=None):
+    """
+    Reduce values with a ufunc from reducer_for(), starting from initializer
+    if given, and return a Python object.
+    """
+    if initializer is None:
+        return to_python(ufunc.reduce(widened(values)))
+    return to_python(ufunc.reduce(widened(values), initial=initializer))
+
+
+def to_python(value):
+    """Convert a NumPy scalar to the equivalent Python object."""
+    return value.item() if isinstance(value, numpy.generic) else value
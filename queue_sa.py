@@ -1,4 +1,5 @@
 from static_array import StaticArray
+from static_array_ops import copy_range, get_unchecked, set_unchecked
 
 
 class QueueException(Exception):
@@ -7,9 +8,13 @@ class QueueException(Exception):
 
 
 class Queue:
-    def __init__(self) -> None:
-        """Initialize new queue based on Static Array."""
-        self._sa = StaticArray(4)
+    def __init__(self, pool=None) -> None:
+        """
+        Initialize new queue based on Static Array.
+        A StaticArrayPool may be passed to recycle arrays when the queue doubles.
+        """
+        self._pool = pool
+        self._sa = StaticArray(4) if pool is None else pool.acquire(4)
         self._front = 0
         self._back = -1
         self._current_size = 0
@@ -22,11 +27,11 @@ class Queue:
 
         front_index = self._front
         for _ in range(size - 1):
-            out += str(self._sa[front_index]) + ', '
+            out += str(get_unchecked(self._sa, front_index)) + ', '
             front_index = self._increment(front_index)
 
         if size > 0:
-            out += str(self._sa[front_index])
+            out += str(get_unchecked(self._sa, front_index))
 
         return out + ']'
 
@@ -72,7 +77,7 @@ class Queue:
             self._double_queue()
 
         self._back = (self._front + self.size()) % self._sa.length() #sets the value of back using modulus (wrapping)
-        self._sa[self._back] = value #adds object
+        set_unchecked(self._sa, self._back, value) #adds object, back is always within the array
         self._current_size += 1
 
     """
@@ -95,7 +100,7 @@ class Queue:
         
         self._current_size -= 1 #decreases size
 
-        val = self._sa[self._front]
+        val = get_unchecked(self._sa, self._front)
 
         if self._front == self._sa.length() - 1: #wrap around case
                 self._front = 0
@@ -121,7 +126,7 @@ class Queue:
         if self.size() < 1:
             raise QueueException
         
-        return self._sa[self._front] #no need to remove
+        return get_unchecked(self._sa, self._front) #no need to remove
 
     # The method below is optional, but recommended, to implement. #
     # You may alter it in any way you see fit.                     #
@@ -130,21 +135,23 @@ class Queue:
         """
         TODO: Write this implementation
         """
-        new_arr = StaticArray(self._sa.length() * 2)
-
-        current = self._front
+        if self._pool is None:
+            new_arr = StaticArray(self._sa.length() * 2)
+        else:
+            new_arr = self._pool.acquire(self._sa.length() * 2)
 
-        for i in range(self.size()):
-            new_arr[i] = self._sa[current] #copies data
-            if current == self._sa.length() - 1:
-                current = 0
-            else:
-                current += 1
+        #copies data in at most two blocks: front to the end of the array, then the wrapped part
+        first = min(self.size(), self._sa.length() - self._front)
+        copy_range(self._sa, self._front, new_arr, 0, first)
+        copy_range(self._sa, 0, new_arr, first, self.size() - first)
 
         self._front = 0
 
         self._back = self.size() - 1
 
+        if self._pool is not None:
+            self._pool.release(self._sa) #hands the old array back for reuse
+
         self._sa = new_arr
 
 
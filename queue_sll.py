@@ -9,10 +9,12 @@ class QueueException(Exception):
 
 
 class Queue:
-    def __init__(self):
+    def __init__(self, node_type=SLNode):
         """
         Initialize new queue with head and tail nodes
+        node_type builds the nodes, e.g. compact_nodes.CompactSLNode
         """
+        self._node_type = node_type
         self._head = None
         self._tail = None
 
@@ -63,7 +65,7 @@ class Queue:
         """
         TODO: Write this implementation
         """
-        new_node = SLNode(value) #creates the node to be added
+        new_node = self._node_type(value) #creates the node to be added
 
         if self.size() == 0: #case if queue is empty
             self._head = new_node
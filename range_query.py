@@ -0,0 +1,355 @@
+from dynamic_array import DynamicArray, DynamicArrayException
+
+
+class SegmentTree:
+    """
+    Range query index over a DynamicArray for any associative operator
+
+    op(a, b) must be associative and identity must satisfy
+    op(identity, x) == op(x, identity) == x (e.g. min with infinity,
+    max with -infinity, operator.add with 0). The order of values is
+    kept, so op does not need to be commutative.
+
+    Attaches itself to the array: set_at_index() and appends that fit the
+    tree are applied as O(log n) point updates, and other changes rebuild
+    the tree in O(n) on the next query. query() is O(log n), except while
+    the array has an exported memoryview(), when every query rebuilds.
+    """
+
+    def __init__(self, da: DynamicArray, op, identity) -> None:
+        """
+        Initialize new segment tree over da and attach it
+        """
+        self._source = da
+        self._op = op
+        self._identity = identity
+        # leaves start at _leaves; node i combines nodes 2i and 2i + 1
+        self._tree = None
+        self._leaves = 0
+        self._count = 0
+        self._stale = True
+        da.attach_index(self)
+
+    def __str__(self) -> str:
+        """
+        Return description of the tree in human-readable form
+        """
+        self._refresh()
+        return f"SEGMENT_TREE Size: {self._count} Leaves: {self._leaves} All: {self.query(0, self._count)}"
+
+    def detach(self) -> None:
+        """
+        Stops tracking the array; queries afterwards see the values at this point
+        """
+        self._refresh()
+        self._source.detach_index(self)
+
+    def length(self) -> int:
+        """
+        Return number of values covered by the tree
+        """
+        self._refresh()
+        return self._count
+
+    # ------------------------------------------------------------------ #
+
+    def rebuild(self) -> None:
+        """
+        Builds the tree from the current values of the array in O(n)
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        source = self._source
+        n = source.length()
+        values = source._data._data
+
+        #a power of two number of leaves keeps the tree complete
+        leaves = 1
+        while leaves < n:
+            leaves *= 2
+
+        identity = self._identity
+        self._tree = DynamicArray.from_iterable(
+            (values[i - leaves] if leaves <= i < leaves + n else identity for i in range(2 * leaves)),
+            size_hint=2 * leaves)
+
+        op = self._op
+        tree = self._tree._data._data
+        for i in range(leaves - 1, 0, -1):
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+        self._leaves = leaves
+        self._count = n
+        self._stale = False
+
+    def _refresh(self) -> None:
+        """
+        Rebuilds the tree if the array changed in a way it did not track,
+        or on every query while the array's storage is exported as a memoryview
+        """
+        if self._stale or self._source._exported:
+            self.rebuild()
+
+    def _invalidate(self) -> None:
+        """
+        Called by the array after a change the tree does not track
+        """
+        self._stale = True
+        self._tree = None
+
+    def _element_set(self, index: int, old, new) -> None:
+        """
+        Called by the array after the value at index changed from old to new
+        """
+        if self._stale:
+            return
+
+        op = self._op
+        tree = self._tree._data._data
+        position = self._leaves + index
+        tree[position] = new
+        position //= 2
+        while position:
+            tree[position] = op(tree[2 * position], tree[2 * position + 1])
+            position //= 2
+
+    def _element_appended(self, value) -> None:
+        """
+        Called by the array after value was appended
+        """
+        if self._stale:
+            return
+
+        if self._count == self._leaves:
+            #no free leaf left, so the tree has to grow
+            self._invalidate()
+            return
+
+        self._count += 1
+        self._element_set(self._count - 1, self._identity, value)
+
+    def update(self, index: int, value) -> None:
+        """
+        Stores value at index of the array, which updates the tree in O(log n)
+
+        Parameters:
+        An int and a value
+
+        Returns:
+        nothing
+        """
+        self._source.set_at_index(index, value)
+
+    def query(self, lo: int, hi: int):
+        """
+        Returns op folded over the values at indices lo..hi-1 in O(log n)
+
+        Parameters:
+        Two ints with 0 <= lo <= hi <= array length
+
+        Returns:
+        the combined value (identity for an empty range)
+        """
+        self._refresh()
+        if lo < 0 or hi < lo or hi > self._count:
+            raise DynamicArrayException
+
+        op = self._op
+        tree = self._tree._data._data
+        left = right = self._identity
+        lo += self._leaves
+        hi += self._leaves
+        while lo < hi:
+            #left and right results are kept apart so the order of values is preserved
+            if lo & 1:
+                left = op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = op(tree[hi], right)
+            lo //= 2
+            hi //= 2
+
+        return op(left, right)
+
+
+class SparseTable:
+    """
+    Range query table over a DynamicArray that rarely changes
+
+    Level k holds op folded over every run of 2 ** k values, which takes
+    O(n log n) to build. For an idempotent op (min, max, gcd, bitwise
+    and/or, where op(x, x) == x) a query combines two overlapping runs in
+    O(1). Any other associative op is answered in O(log n) from
+    non-overlapping runs; pass idempotent=False for those.
+
+    Attaches itself to the array and rebuilds on the next query after
+    any change, and on every query while the array has an exported
+    memoryview().
+    """
+
+    def __init__(self, da: DynamicArray, op, idempotent: bool = True) -> None:
+        """
+        Initialize new sparse table over da and attach it
+        """
+        self._source = da
+        self._op = op
+        self._idempotent = idempotent
+        self._levels = None
+        self._count = 0
+        da.attach_index(self)
+
+    def __str__(self) -> str:
+        """
+        Return description of the table in human-readable form
+        """
+        self._refresh()
+        return f"SPARSE_TABLE Size: {self._count} Levels: {self._levels.length()}"
+
+    def detach(self) -> None:
+        """
+        Stops tracking the array; queries afterwards see the values at this point
+        """
+        self._refresh()
+        self._source.detach_index(self)
+
+    def length(self) -> int:
+        """
+        Return number of values covered by the table
+        """
+        self._refresh()
+        return self._count
+
+    # ------------------------------------------------------------------ #
+
+    def rebuild(self) -> None:
+        """
+        Builds every level from the current values of the array in O(n log n)
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        source = self._source
+        n = source.length()
+        values = source._data._data
+        op = self._op
+
+        self._levels = DynamicArray()
+        level = DynamicArray.from_iterable((values[i] for i in range(n)), size_hint=n)
+        width = 1
+        while level.length():
+            self._levels.append(level)
+            previous = level._data._data
+            level = DynamicArray.from_iterable(
+                (op(previous[i], previous[i + width]) for i in range(n - 2 * width + 1)),
+                size_hint=max(n - 2 * width + 1, 0))
+            width *= 2
+
+        self._count = n
+
+    def _refresh(self) -> None:
+        """
+        Rebuilds the table if the array changed since it was built,
+        or on every query while the array's storage is exported as a memoryview
+        """
+        if self._levels is None or self._source._exported:
+            self.rebuild()
+
+    def _invalidate(self) -> None:
+        """
+        Called by the array after any change
+        """
+        self._levels = None
+
+    def _element_set(self, index: int, old, new) -> None:
+        """
+        Called by the array after the value at index changed
+        """
+        self._levels = None
+
+    def _element_appended(self, value) -> None:
+        """
+        Called by the array after value was appended
+        """
+        self._levels = None
+
+    def query(self, lo: int, hi: int):
+        """
+        Returns op folded over the values at indices lo..hi-1
+
+        Parameters:
+        Two ints with 0 <= lo < hi <= array length
+
+        Returns:
+        the combined value
+        """
+        self._refresh()
+        if lo < 0 or hi <= lo or hi > self._count:
+            raise DynamicArrayException
+
+        levels = self._levels
+        if self._idempotent:
+            #two runs of the largest fitting width cover the range, overlapping in the middle
+            k = (hi - lo).bit_length() - 1
+            level = levels[k]
+            return self._op(level[lo], level[hi - (1 << k)])
+
+        #otherwise the range is split into runs of decreasing power-of-two width
+        k = (hi - lo).bit_length() - 1
+        result = levels[k][lo]
+        lo += 1 << k
+        while lo < hi:
+            k = (hi - lo).bit_length() - 1
+            result = self._op(result, levels[k][lo])
+            lo += 1 << k
+
+        return result
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    import operator
+
+    print("\n# SegmentTree min / sum - example 1")
+    da = DynamicArray([5, 3, 8, 1, 9, 2, 7], typecode='q')
+    low = SegmentTree(da, min, float('inf'))
+    total = SegmentTree(da, operator.add, 0)
+    print(low, low.query(0, 3), low.query(2, 7), total.query(1, 4), total.query(3, 3))
+
+    print("\n# SegmentTree point updates and appends - example 1")
+    low.update(3, 6)
+    da.append(0)
+    print(low.query(2, 7), low.query(0, da.length()), total.query(0, da.length()))
+    da.remove_at_index(0)
+    print(low.query(0, 3), total.query(0, da.length()))
+
+    print("\n# SegmentTree with a non-commutative op - example 1")
+    words = DynamicArray(["a", "b", "c", "d", "e"])
+    concat = SegmentTree(words, operator.add, "")
+    words[1] = "B"
+    print(concat.query(0, 5), concat.query(1, 4))
+
+    print("\n# SparseTable max / sum - example 1")
+    da = DynamicArray([2, 7, 1, 8, 2, 8, 1, 8, 2, 8], typecode='q')
+    high = SparseTable(da, max)
+    total = SparseTable(da, operator.add, idempotent=False)
+    print(high, high.query(0, 3), high.query(2, 3), total.query(0, 10), total.query(3, 8))
+    da[2] = 100
+    print(high.query(0, 3), total.query(0, 3))
+
+    print("\n# index errors - example 1")
+    for lo, hi in ((-1, 2), (3, 3), (0, 11)):
+        try:
+            high.query(lo, hi)
+        except DynamicArrayException as e:
+            print("Exception raised:", type(e))
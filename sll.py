@@ -9,11 +9,13 @@ class SLLException(Exception):
 
 
 class LinkedList:
-    def __init__(self, start_list=None) -> None:
+    def __init__(self, start_list=None, node_type=SLNode) -> None:
         """
         Initialize new linked list
+        node_type builds the nodes, e.g. compact_nodes.CompactSLNode
         """
-        self._head = SLNode(None)
+        self._node_type = node_type
+        self._head = node_type(None)
 
         # populate SLL with initial values (if provided)
         # before using this feature, implement insert_back() method
@@ -69,10 +71,10 @@ class LinkedList:
         TODO: Write this implementation
         """
         if self._head.next is None: #checks if its empty
-            self._head.next = SLNode(value)
+            self._head.next = self._node_type(value)
         else:
             temp = self._head.next
-            self._head.next = SLNode(value, temp)
+            self._head.next = self._node_type(value, temp)
 
     """
     Inserts a new node at the back of the list
@@ -95,7 +97,7 @@ class LinkedList:
         for i in range(self.length()):
             current = current.next #traverses to back
 
-        current.next = SLNode(value)
+        current.next = self._node_type(value)
 
     """
     Inserts a new node at a sepcified index
@@ -121,7 +123,7 @@ class LinkedList:
         
         temp = current.next
 
-        current.next = SLNode(value, temp)
+        current.next = self._node_type(value, temp)
 
     """
     Removes a new node at a sepcified index
@@ -254,7 +256,7 @@ class LinkedList:
         for i in range(start_index):
             current = current.next
 
-        new_linked_list = LinkedList()
+        new_linked_list = LinkedList(node_type=self._node_type)
 
         for i in range(size):
             new_linked_list.insert_back(current.next.value) #adds values according to size
@@ -0,0 +1,229 @@
+from dynamic_array import DynamicArray, DynamicArrayException, DynamicArrayView
+
+
+class SortedDynamicArray:
+    def __init__(self, start_array=None, typecode=None):
+        """
+        Init new sorted array based on Dynamic Array
+
+        Values are kept in ascending order, so lookups use binary search.
+        """
+        self._da = DynamicArray(typecode=typecode)
+
+        # populate sorted array with initial values (if provided)
+        if start_array is not None:
+            self.extend(start_array)
+
+    def __str__(self) -> str:
+        """
+        Return content of sorted array in human-readable form
+        """
+        out = "SORTED_ARR: " + str(self._da.length()) + " elements. ["
+        out += ', '.join([str(value) for value in self._da])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the values in ascending order
+        """
+        return iter(self._da)
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return the value at given position of the sorted order
+        Invalid index raises DynamicArrayException
+        """
+        return self._da.get_at_index(index)
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index(), using array[index] syntax
+        """
+        return self._da.get_at_index(index)
+
+    def length(self) -> int:
+        """
+        Return number of values stored
+        """
+        return self._da.length()
+
+    def is_empty(self) -> bool:
+        """
+        Return True if there are no values / False otherwise
+        """
+        return self._da.is_empty()
+
+    # -----------------------------------------------------------------------
+
+    def bisect_left(self, value: object) -> int:
+        """
+        returns the first position where value could be inserted keeping the order
+
+        Parameters:
+        An object
+
+        Returns:
+        an int
+        """
+        low, high = 0, self._da.length()
+        while low < high:
+            middle = (low + high) // 2
+            if self._da[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def bisect_right(self, value: object) -> int:
+        """
+        returns the position after the last value equal to value
+
+        Parameters:
+        An object
+
+        Returns:
+        an int
+        """
+        low, high = 0, self._da.length()
+        while low < high:
+            middle = (low + high) // 2
+            if value < self._da[middle]:
+                high = middle
+            else:
+                low = middle + 1
+
+        return low
+
+    def add(self, value: object) -> None:
+        """
+        adds a value at its sorted position (after any equal values)
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        self._da.insert_at_index(self.bisect_right(value), value)
+
+    def extend(self, values) -> None:
+        """
+        adds many values at once, then restores the order with one sort
+
+        Parameters:
+        An iterable
+
+        Returns:
+        nothing
+        """
+        #the existing values form one sorted run, which the adaptive sort reuses
+        self._da.extend(values)
+        self._da.sort()
+
+    def remove(self, value: object) -> bool:
+        """
+        removes one occurrence of value
+
+        Parameters:
+        An object
+
+        Returns:
+        True if a value was removed, False otherwise
+        """
+        position = self.bisect_left(value)
+        if position == self._da.length() or self._da[position] != value:
+            return False
+
+        self._da.remove_at_index(position)
+        return True
+
+    def contains(self, value: object) -> bool:
+        """
+        checks if value is stored, in O(log n)
+
+        Parameters:
+        An object
+
+        Returns:
+        a boolean
+        """
+        position = self.bisect_left(value)
+        return position < self._da.length() and self._da[position] == value
+
+    def index(self, value: object) -> int:
+        """
+        returns the position of the first occurrence of value
+        Missing value raises DynamicArrayException
+
+        Parameters:
+        An object
+
+        Returns:
+        an int
+        """
+        position = self.bisect_left(value)
+        if position == self._da.length() or self._da[position] != value:
+            raise DynamicArrayException
+
+        return position
+
+    def count(self, value: object) -> int:
+        """
+        counts the occurrences of value, in O(log n)
+
+        Parameters:
+        An object
+
+        Returns:
+        an int
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def range(self, low: object, high: object) -> DynamicArrayView:
+        """
+        returns the values v with low <= v < high as a view, without copying them
+
+        Parameters:
+        lower (inclusive) and upper (exclusive) bounds
+
+        Returns:
+        a DynamicArrayView
+        """
+        start = self.bisect_left(low)
+        end = max(self.bisect_left(high), start)
+        return self._da.view(start, end - start)
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# add / remove - example 1")
+    sa = SortedDynamicArray([50, 10, 40, 10, 30])
+    print(sa)
+    sa.add(20)
+    sa.add(10)
+    print(sa)
+    print(sa.remove(10), sa.remove(35))
+    print(sa)
+
+    print("\n# contains / index / count - example 1")
+    sa = SortedDynamicArray([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], typecode='q')
+    print(sa)
+    print(sa.contains(9), sa.contains(7))
+    print(sa.index(5), sa.count(5), sa.count(7))
+    print(sa.bisect_left(5), sa.bisect_right(5))
+    try:
+        sa.index(7)
+    except DynamicArrayException as e:
+        print("Exception raised:", type(e))
+
+    print("\n# range - example 1")
+    sa = SortedDynamicArray(["kiwi", "apple", "fig", "banana", "cherry", "date"])
+    print(sa.range("b", "e"))
+    print(sa.range("x", "z"))
+    fruits = sa.range("c", "g")
+    sa.add("coconut")
+    print(fruits, sa, sep="\n")
@@ -9,10 +9,12 @@ class StackException(Exception):
 
 
 class Stack:
-    def __init__(self) -> None:
+    def __init__(self, node_type=SLNode) -> None:
         """
         Initialize new stack with head node
+        node_type builds the nodes, e.g. compact_nodes.CompactSLNode
         """
+        self._node_type = node_type
         self._head = None
 
     def __str__(self) -> str:
@@ -64,7 +66,7 @@ class Stack:
         TODO: Write this implementation
         """
         
-        new_node = SLNode(value, self._head) #creates new node
+        new_node = self._node_type(value, self._head) #creates new node
 
         self._head = new_node #puts it at the beginning
 
@@ -0,0 +1,117 @@
+"""
+Block operations on StaticArray-style storage.
+
+StaticArray itself must stay unchanged, and copying through its get()/set()
+costs a method call and a bounds check per element. These helpers check
+the bounds once per call and then copy with slice assignment on the
+underlying buffers. They accept StaticArray, TypedStaticArray and any
+other storage exposing length() and a list, array.array or memoryview
+in _data.
+"""
+import array
+
+from static_array import StaticArrayException
+
+
+def _check_range(storage, offset: int, count: int) -> None:
+    """Raise StaticArrayException unless offset..offset+count-1 lies inside storage."""
+    if count < 0 or offset < 0 or offset + count > storage.length():
+        raise StaticArrayException('Index out of bounds')
+
+
+def copy_range(src, src_off: int, dst, dst_off: int, n: int) -> None:
+    """
+    Copy n elements from src starting at src_off to dst starting at dst_off.
+    src and dst may be the same storage; overlapping ranges are copied
+    as if through a temporary buffer.
+    Ranges outside either storage raise StaticArrayException before anything is copied.
+    """
+    _check_range(src, src_off, n)
+    _check_range(dst, dst_off, n)
+    if n == 0:
+        return
+
+    source = src._data
+    target = dst._data
+    if isinstance(target, list):
+        target[dst_off:dst_off + n] = source[src_off:src_off + n]
+    elif not isinstance(source, list) and memoryview(source).format == memoryview(target).format:
+        # memoryview assignment copies between arrays and mapped files alike
+        memoryview(target)[dst_off:dst_off + n] = memoryview(source)[src_off:src_off + n]
+    else:
+        # typed storage converts each value, e.g. from a list or another typecode
+        if source is target and src_off < dst_off:
+            source = source[src_off:src_off + n]
+            src_off = 0
+        for i in range(n):
+            target[dst_off + i] = source[src_off + i]
+
+
+def get_unchecked(storage, index: int):
+    """
+    Return the value at index without a bounds check.
+    Only for callers that have already proven 0 <= index < storage.length().
+    """
+    return storage._data[index]
+
+
+def set_unchecked(storage, index: int, value) -> None:
+    """
+    Store value at index without a bounds check.
+    Only for callers that have already proven 0 <= index < storage.length().
+    """
+    storage._data[index] = value
+
+
+def fill(dst, dst_off: int, n: int, value) -> None:
+    """
+    Store value in the n elements of dst starting at dst_off.
+    Ranges outside the storage raise StaticArrayException before anything is stored.
+    """
+    _check_range(dst, dst_off, n)
+    if n == 0:
+        return
+
+    target = dst._data
+    if isinstance(target, list):
+        target[dst_off:dst_off + n] = [value] * n
+    else:
+        memoryview(target)[dst_off:dst_off + n] = array.array(memoryview(target).format, [value]) * n
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    from static_array import StaticArray
+    from typed_array import TypedStaticArray
+
+    print("\n# copy_range - example 1")
+    src = StaticArray(6)
+    for i in range(6):
+        src[i] = i * 10
+    dst = StaticArray(8)
+    copy_range(src, 2, dst, 1, 4)
+    print(dst)
+    copy_range(dst, 1, dst, 3, 4)
+    print(dst)
+
+    print("\n# copy_range between typed and object storage - example 1")
+    typed = TypedStaticArray('d', 5)
+    copy_range(src, 0, typed, 0, 5)
+    print(typed)
+    copy_range(typed, 1, src, 0, 3)
+    print(src)
+
+    print("\n# fill - example 1")
+    fill(dst, 0, 3, 'x')
+    fill(typed, 2, 3, -1)
+    print(dst, typed)
+
+    print("\n# index errors - example 1")
+    for args in ((src, 4, dst, 0, 3), (src, 0, dst, 6, 3), (src, -1, dst, 0, 1)):
+        try:
+            copy_range(*args)
+        except StaticArrayException as e:
+            print("Exception raised:", type(e))
@@ -0,0 +1,146 @@
+import sys
+
+from static_array import StaticArray
+from static_array_ops import fill
+from typed_array import TypedStaticArray
+
+
+class StaticArrayPool:
+    """
+    Recycles StaticArray and TypedStaticArray buffers by power-of-two size class
+
+    Arrays that opt in (DynamicArray(pool=...), Queue(pool=...)) take
+    their storage from acquire() and hand storage they no longer need to
+    release(), so churn between the same sizes reuses buffers instead of
+    allocating new ones. Every buffer has a power-of-two length. Released
+    buffers are cleared (None for objects, 0 for typed buffers), so they
+    keep no values alive and the next owner never sees old data. Buffers
+    are kept until the pool holds max_bytes, after which further buffers
+    are left to the garbage collector. This saves allocations and peak
+    memory churn rather than time: on CPython the clearing and bookkeeping
+    cost about as much as allocating a fresh buffer.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2 ** 20) -> None:
+        """
+        Initialize new empty pool keeping at most max_bytes of free buffers
+        """
+        self._max_bytes = max_bytes
+        # free buffers by (typecode or None, length)
+        self._free = {}
+        self._pooled_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._releases = 0
+        self._dropped = 0
+
+    def __str__(self) -> str:
+        """
+        Return pool statistics in human-readable form
+        """
+        stats = self.get_stats()
+        return "STATIC_ARRAY_POOL " + ', '.join([f"{key}: {value}" for key, value in stats.items()])
+
+    @staticmethod
+    def size_class(size: int) -> int:
+        """
+        Return the length of the buffers handed out for size elements
+        (the next power of two, at least 1)
+        """
+        return 1 << max(size - 1, 0).bit_length()
+
+    def get_stats(self) -> dict:
+        """
+        Return the number of hits, misses, releases and dropped buffers,
+        and the number of free buffers and bytes currently kept
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'releases': self._releases,
+            'dropped': self._dropped,
+            'free_buffers': sum(len(buffers) for buffers in self._free.values()),
+            'pooled_bytes': self._pooled_bytes,
+        }
+
+    def acquire(self, size: int, typecode=None):
+        """
+        Return a cleared buffer able to hold size elements, reusing a free one if possible
+
+        Parameters:
+        An int and optional typecode (None for a StaticArray of objects)
+
+        Returns:
+        a StaticArray or TypedStaticArray of length size_class(size)
+        """
+        length = StaticArrayPool.size_class(size)
+        buffers = self._free.get((typecode, length))
+        if buffers:
+            self._hits += 1
+            storage = buffers.pop()
+            self._pooled_bytes -= sys.getsizeof(storage._data)
+            return storage
+
+        self._misses += 1
+        if typecode is None:
+            return StaticArray(length)
+        return TypedStaticArray(typecode, length)
+
+    def release(self, storage) -> bool:
+        """
+        Takes back a buffer that its owner no longer uses
+
+        The caller must make sure nothing else still reads the buffer.
+        Buffers that did not come from a pool size class, or that would
+        take the pool over its memory cap, are not kept.
+
+        Parameters:
+        A StaticArray or TypedStaticArray
+
+        Returns:
+        True if the buffer was kept for reuse
+        """
+        if type(storage) is StaticArray:
+            key = (None, storage.length())
+        elif type(storage) is TypedStaticArray:
+            key = (storage.typecode(), storage.length())
+        else:
+            return False
+
+        size = sys.getsizeof(storage._data)
+        if key[1] != StaticArrayPool.size_class(key[1]) or self._pooled_bytes + size > self._max_bytes:
+            self._dropped += 1
+            return False
+
+        #clears buffers so pooled arrays keep no values alive and leak none to the next owner
+        fill(storage, 0, storage.length(), None if key[0] is None else 0)
+        self._free.setdefault(key, []).append(storage)
+        self._pooled_bytes += size
+        self._releases += 1
+        return True
+
+    def clear(self) -> None:
+        """
+        Drops every free buffer
+        """
+        self._free = {}
+        self._pooled_bytes = 0
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# acquire / release - example 1")
+    pool = StaticArrayPool()
+    first = pool.acquire(5)
+    first[0] = 'value'
+    print(first.length(), pool.release(first), pool)
+    again = pool.acquire(7)
+    print(again is first, again[0], pool.acquire(7, 'd'), pool)
+
+    print("\n# memory cap - example 1")
+    pool = StaticArrayPool(max_bytes=1000)
+    print(pool.release(StaticArray(64)), pool.release(StaticArray(64)), pool.release(StaticArray(10)))
+    print(pool)
@@ -0,0 +1,437 @@
+from static_array import StaticArray
+from dynamic_array import DynamicArray, DynamicArrayException
+
+
+class _RingBlock:
+    """
+    Fixed-size circular buffer used as one block of a TieredArray
+    """
+
+    def __init__(self, block_size: int) -> None:
+        """
+        Initialize new empty block; block_size must be a power of two
+        """
+        self._data = StaticArray(block_size)
+        self._mask = block_size - 1
+        self._head = 0
+        self._count = 0
+
+    def get(self, index: int) -> object:
+        """Return value at position index of the block."""
+        return self._data[(self._head + index) & self._mask]
+
+    def set(self, index: int, value: object) -> None:
+        """Store value at position index of the block."""
+        self._data[(self._head + index) & self._mask] = value
+
+    def insert(self, index: int, value: object) -> None:
+        """Insert value at position index, shifting later values right (block must not be full)."""
+        data, mask, head = self._data, self._mask, self._head
+        for i in range(self._count, index, -1):
+            data[(head + i) & mask] = data[(head + i - 1) & mask]
+        data[(head + index) & mask] = value
+        self._count += 1
+
+    def remove(self, index: int) -> None:
+        """Remove the value at position index, shifting later values left."""
+        data, mask, head = self._data, self._mask, self._head
+        for i in range(index, self._count - 1):
+            data[(head + i) & mask] = data[(head + i + 1) & mask]
+        self._count -= 1
+        data[(head + self._count) & mask] = None
+
+    def push_front(self, value: object) -> None:
+        """Add value before the first position (block must not be full)."""
+        self._head = (self._head - 1) & self._mask
+        self._data[self._head] = value
+        self._count += 1
+
+    def push_back(self, value: object) -> None:
+        """Add value after the last position (block must not be full)."""
+        self._data[(self._head + self._count) & self._mask] = value
+        self._count += 1
+
+    def pop_front(self) -> object:
+        """Remove and return the first value."""
+        value = self._data[self._head]
+        self._data[self._head] = None
+        self._head = (self._head + 1) & self._mask
+        self._count -= 1
+        return value
+
+    def pop_back(self) -> object:
+        """Remove and return the last value."""
+        self._count -= 1
+        position = (self._head + self._count) & self._mask
+        value = self._data[position]
+        self._data[position] = None
+        return value
+
+
+class TieredArray:
+    """
+    Dynamic array built from fixed-size StaticArray blocks (sqrt decomposition)
+
+    Supports the DynamicArray API. Every block except the last one is full,
+    so indexing is O(1). Inserting or removing at an arbitrary index shifts
+    values inside one block and then moves a single value between each pair
+    of following blocks, which is O(sqrt n) because the block size is kept
+    close to sqrt(n).
+    """
+
+    _MIN_BLOCK_SIZE = 16
+
+    def __init__(self, start_array=None) -> None:
+        """
+        Initialize new tiered array
+        """
+        self._size = 0
+        self._set_block_size(TieredArray._MIN_BLOCK_SIZE)
+        self._blocks = DynamicArray()
+
+        if start_array is not None:
+            for value in start_array:
+                self.append(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of tiered array in human-readable form
+        """
+        out = "TIERED_ARR Size/Cap: "
+        out += str(self._size) + "/" + str(self.get_capacity()) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the values block by block
+        """
+        for k in range(self._blocks.length()):
+            block = self._blocks[k]
+            for i in range(block._count):
+                yield block.get(i)
+
+    def _set_block_size(self, block_size: int) -> None:
+        """
+        Remember the block size and the shift/mask used to split indices
+        """
+        self._block_size = block_size
+        self._shift = block_size.bit_length() - 1
+        self._mask = block_size - 1
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._blocks[index >> self._shift].get(index & self._mask)
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._blocks[index >> self._shift].set(index & self._mask, value)
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index(), using array[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index(), using array[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True if array is empty / False otherwise
+        """
+        return self._size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in array
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return the number of slots in the allocated blocks
+        """
+        return self._blocks.length() * self._block_size
+
+    def get_block_size(self) -> int:
+        """
+        Return the current block size
+        """
+        return self._block_size
+
+    # ------------------------------------------------------------------ #
+
+    def _rebuild(self, block_size: int) -> None:
+        """
+        copies all values into new blocks of the given size
+
+        Parameters:
+        An int (power of two)
+
+        Returns:
+        nothing
+        """
+        old_blocks = self._blocks
+        self._set_block_size(block_size)
+        self._blocks = DynamicArray()
+
+        block = None
+        for k in range(old_blocks.length()):
+            old = old_blocks[k]
+            for i in range(old._count):
+                if block is None or block._count == block_size:
+                    block = _RingBlock(block_size)
+                    self._blocks.append(block)
+                block.push_back(old.get(i))
+
+    def _fit_block_size(self) -> None:
+        """
+        keeps the block size near sqrt(size) by rebuilding when it drifts too far
+
+        Parameters:
+        nothing
+
+        Returns:
+        nothing
+        """
+        block_size = self._block_size
+        if self._size > 2 * block_size * block_size:
+            self._rebuild(block_size * 2)
+        elif block_size > TieredArray._MIN_BLOCK_SIZE and self._size * 8 < block_size * block_size:
+            self._rebuild(block_size // 2)
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Chooses the block size suited to holding new_capacity elements
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        if new_capacity < 1 or new_capacity < self._size:
+            return
+
+        block_size = TieredArray._MIN_BLOCK_SIZE
+        while 2 * block_size * block_size < new_capacity:
+            block_size *= 2
+
+        if block_size != self._block_size:
+            self._rebuild(block_size)
+
+    def append(self, value: object) -> None:
+        """
+        Adds an object to the end of the array, adding a block when the last one is full
+
+        Parameters:
+        An object
+
+        Returns:
+        nothing
+        """
+        last = self._blocks.length() - 1
+        if last < 0 or self._blocks[last]._count == self._block_size:
+            self._blocks.append(_RingBlock(self._block_size))
+            last += 1
+
+        self._blocks[last].push_back(value)
+        self._size += 1
+        self._fit_block_size()
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Inserts new object at specified index in O(sqrt n)
+
+        Parameters:
+        An int and object
+
+        Returns:
+        nothing
+        """
+        if index < 0 or index > self._size:
+            raise DynamicArrayException
+
+        if index == self._size:
+            self.append(value)
+            return
+
+        blocks = self._blocks
+        last = blocks.length() - 1
+        if blocks[last]._count == self._block_size:
+            blocks.append(_RingBlock(self._block_size))
+            last += 1
+
+        #makes room in the target block by moving one value into each following block
+        target = index >> self._shift
+        for k in range(last, target, -1):
+            blocks[k].push_front(blocks[k - 1].pop_back())
+
+        blocks[target].insert(index & self._mask, value)
+        self._size += 1
+        self._fit_block_size()
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes object at specified index in O(sqrt n)
+
+        Parameters:
+        An int
+
+        Returns:
+        nothing
+        """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+
+        blocks = self._blocks
+        last = blocks.length() - 1
+        target = index >> self._shift
+        blocks[target].remove(index & self._mask)
+
+        #refills the target block by moving one value back out of each following block
+        for k in range(target + 1, last + 1):
+            blocks[k - 1].push_back(blocks[k].pop_front())
+
+        if blocks[last]._count == 0:
+            blocks.remove_at_index(last)
+
+        self._size -= 1
+        self._fit_block_size()
+
+    def slice(self, start_index: int, size: int) -> "TieredArray":
+        """
+        Returns a new array with specified starting index of old array and size
+
+        Parameters:
+        Two ints
+
+        Returns:
+        new tiered array
+        """
+        if size < 0 or start_index < 0 or start_index > self._size - 1 or start_index + size > self._size:
+            raise DynamicArrayException
+
+        new_arr = TieredArray()
+        for i in range(start_index, start_index + size):
+            new_arr.append(self[i])
+
+        return new_arr
+
+    def merge(self, second_da) -> None:
+        """
+        Adds the values of another array to the end of this one
+
+        Parameters:
+        A second array
+
+        Returns:
+        nothing
+        """
+        for i in range(second_da.length()):
+            self.append(second_da[i])
+
+    def map(self, map_func) -> "TieredArray":
+        """
+        returns a new array with each value being put into the passed in function
+
+        Parameters:
+        A function
+
+        Returns:
+        new tiered array
+        """
+        new_arr = TieredArray()
+        for value in self:
+            new_arr.append(map_func(value))
+
+        return new_arr
+
+    def filter(self, filter_func) -> "TieredArray":
+        """
+        returns a new array with each value that satisfies the function staying in
+
+        Parameters:
+        A function
+
+        Returns:
+        new tiered array
+        """
+        new_arr = TieredArray()
+        for value in self:
+            if filter_func(value):
+                new_arr.append(value)
+
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        returns an object with the passed in function being applied sequentially
+
+        Parameters:
+        A function and optional initializer
+
+        Returns:
+        an object
+        """
+        values = iter(self)
+        accumulator = initializer
+        if accumulator is None:
+            for accumulator in values:
+                break
+            else:
+                return initializer
+
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
+
+        return accumulator
+
+
+# ------------------- BASIC TESTING -----------------------------------------
+
+
+if __name__ == "__main__":
+
+    print("\n# insert_at_index / remove_at_index - example 1")
+    ta = TieredArray(range(40))
+    print(ta)
+    ta.insert_at_index(0, -1)
+    ta.insert_at_index(20, 'mid')
+    ta.remove_at_index(35)
+    print(ta, ta.get_block_size())
+
+    print("\n# block size follows sqrt(n) - example 1")
+    ta = TieredArray()
+    for i in range(5000):
+        ta.insert_at_index(i // 2, i)
+    print(ta.length(), ta.get_block_size(), ta.get_capacity())
+    for _ in range(4900):
+        ta.remove_at_index(0)
+    print(ta.length(), ta.get_block_size(), ta.get_capacity())
+
+    print("\n# index errors - example 1")
+    for index in (-1, 101):
+        try:
+            ta.insert_at_index(index, 0)
+        except DynamicArrayException as e:
+            print("Exception raised:", type(e))
+
+    print("\n# slice / map / filter / reduce - example 1")
+    ta = TieredArray([1, 5, 10, 15, 20, 25])
+    print(ta.slice(1, 3), ta.map(lambda x: x * 2))
+    print(ta.filter(lambda x: x > 9), ta.reduce(lambda x, y: x + y))
@@ -0,0 +1,76 @@
+import array
+
+from static_array import StaticArrayException
+
+
+class TypedStaticArray:
+    """
+    Fixed-size array storing machine-typed numbers in a compact buffer.
+    Implemented methods: get(), set(), length()
+
+    Mirrors the StaticArray interface so it can be used as the backing
+    storage of a DynamicArray. Values are kept unboxed in an array.array
+    of the given typecode ('q' for 64-bit ints, 'd' for doubles, etc.).
+    """
+
+    def __init__(self, typecode: str, size: int = 10) -> None:
+        """
+        Create array of given typecode and size.
+        Initialize all elements with values of zero.
+        If requested size is not a positive number,
+        raise StaticArray Exception.
+        """
+        if size < 1:
+            raise StaticArrayException('Array size must be a positive integer')
+
+        self._typecode = typecode
+        self._size = size
+
+        self._data = array.array(typecode, [0]) * size
+
+    def __iter__(self) -> None:
+        """Disable iterator capability, same as StaticArray."""
+        return None
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return f"TYPED_ARR '{self._typecode}' Size: {self._size} {self._data.tolist()}"
+
+    def get(self, index: int):
+        """
+        Return value from given index position.
+        Invalid index raises StaticArrayException.
+        """
+        if index < 0 or index >= self._size:
+            raise StaticArrayException('Index out of bounds')
+        return self._data[index]
+
+    def set(self, index: int, value) -> None:
+        """
+        Store value at given index in the array.
+        Invalid index raises StaticArrayException.
+        Values that do not fit the typecode raise TypeError/OverflowError.
+        """
+        if index < 0 or index >= self._size:
+            raise StaticArrayException('Index out of bounds')
+        self._data[index] = value
+
+    def __getitem__(self, index: int):
+        """Enable bracketed indexing."""
+        return self.get(index)
+
+    def __setitem__(self, index: int, value) -> None:
+        """Enable bracketed indexing."""
+        self.set(index, value)
+
+    def length(self) -> int:
+        """Return length of the array (number of elements)."""
+        return self._size
+
+    def typecode(self) -> str:
+        """Return the array.array typecode of the stored elements."""
+        return self._typecode
+
+    def itemsize(self) -> int:
+        """Return the size in bytes of one stored element."""
+        return self._data.itemsize